@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -11,6 +12,11 @@ from send2trash import send2trash
 
 from fclean.scanner import FileInfo
 
+# Files handed to send2trash per call (amortizes Recycle Bin / D-Bus round-trips)
+_TRASH_BATCH_SIZE = 256
+# lstat/unlink are syscall-bound and release the GIL
+_DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 @dataclass
 class CleanResult:
@@ -22,11 +28,99 @@ class CleanResult:
     total_freed: int = 0
 
 
+def _record(result: CleanResult, fi: FileInfo, outcome: str, reason: str = "") -> None:
+    """Add one file's outcome ("deleted", "skipped" or "failed") to result."""
+    if outcome == "deleted":
+        result.deleted.append(fi.path)
+        result.total_freed += fi.size
+    elif outcome == "skipped":
+        result.skipped.append((fi.path, reason))
+    else:
+        result.failed.append((fi.path, reason))
+
+
+def _verify(path: str) -> tuple[str, str]:
+    """Re-check that path is still a regular file (TOCTOU mitigation).
+
+    Returns ("ok", "") or (outcome, reason). Symlinks are skipped to prevent
+    symlink-based attacks.
+    """
+    try:
+        current = os.lstat(path)
+    except OSError as e:
+        return "failed", str(e)
+    if stat.S_ISLNK(current.st_mode):
+        return "skipped", "symlink"
+    if not stat.S_ISREG(current.st_mode):
+        return "skipped", "no longer a regular file"
+    return "ok", ""
+
+
+def _verify_and_unlink(path: str) -> tuple[str, str]:
+    """Re-check then permanently delete a single file."""
+    outcome, reason = _verify(path)
+    if outcome != "ok":
+        return outcome, reason
+    try:
+        os.unlink(path)
+    except OSError as e:
+        return "failed", str(e)
+    return "deleted", ""
+
+
+def _failed_index(batch: list[FileInfo], error: OSError) -> int | None:
+    """Index of the file a batch send2trash call stopped at (None if unknown).
+
+    send2trash handles paths in order and may name the failing one in the
+    error, either as its filename (str or bytes) or at the end of the message.
+    The Windows backends set filename to the whole list of paths instead.
+    """
+    filename = error.filename
+    if isinstance(filename, (str, bytes, os.PathLike)):
+        target, exact = os.fsdecode(filename), True
+    else:
+        target, exact = str(error), False
+    for i, fi in enumerate(batch):
+        if target == fi.path_str or (not exact and target.endswith(" " + fi.path_str)):
+            return i
+    return None
+
+
+def _trash_batch(result: CleanResult, batch: list[FileInfo]) -> None:
+    """Trash a batch in one send2trash call, falling back to per-file calls."""
+    try:
+        send2trash([fi.path_str for fi in batch])
+    except OSError as e:
+        error = e
+    else:
+        for fi in batch:
+            _record(result, fi, "deleted")
+        return
+
+    # The batch call trashed the files before the failing one; retry the rest
+    # one by one so each failure is attributed to the right file. A file that
+    # vanished on its own is reported by its retry, not counted as freed.
+    # When the error doesn't say where the batch stopped, every file that
+    # passed _verify and is now gone is taken to be trashed.
+    failed_at = _failed_index(batch, error)
+    for i, fi in enumerate(batch):
+        trashed_before = failed_at is None or i < failed_at
+        if trashed_before and not os.path.lexists(fi.path_str):
+            _record(result, fi, "deleted")
+            continue
+        try:
+            send2trash(fi.path_str)
+            _record(result, fi, "deleted")
+        except OSError as e:
+            _record(result, fi, "failed", str(e))
+
+
 def delete_files(
     files: list[FileInfo],
     *,
     use_trash: bool = True,
     dry_run: bool = False,
+    max_workers: int | None = None,
 ) -> CleanResult:
     """Delete or trash the given files.
 
@@ -34,38 +128,37 @@ def delete_files(
         files: Files to delete.
         use_trash: If True, move to trash instead of permanent delete.
         dry_run: If True, don't actually delete anything.
+        max_workers: Threads used for re-checks and permanent deletes. None = auto.
     """
     result = CleanResult()
 
-    for fi in files:
-        if dry_run:
-            result.deleted.append(fi.path)
-            result.total_freed += fi.size
-            continue
+    if dry_run:
+        for fi in files:
+            _record(result, fi, "deleted")
+        return result
 
-        # Safety: skip symlinks to prevent symlink-based attacks
-        if fi.path.is_symlink():
-            result.skipped.append((fi.path, "symlink"))
-            continue
+    if not files:
+        return result
 
-        # Safety: re-verify file is still a regular file (TOCTOU mitigation)
-        try:
-            current = fi.path.lstat()
-            if not stat.S_ISREG(current.st_mode):
-                result.skipped.append((fi.path, "no longer a regular file"))
-                continue
-        except OSError as e:
-            result.failed.append((fi.path, str(e)))
-            continue
+    if max_workers is None:
+        max_workers = _DEFAULT_MAX_WORKERS
 
-        try:
-            if use_trash:
-                send2trash(str(fi.path))
-            else:
-                os.remove(fi.path)
-            result.deleted.append(fi.path)
-            result.total_freed += fi.size
-        except OSError as e:
-            result.failed.append((fi.path, str(e)))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        if not use_trash:
+            outcomes = executor.map(_verify_and_unlink, [fi.path_str for fi in files])
+            for fi, (outcome, reason) in zip(files, outcomes):
+                _record(result, fi, outcome, reason)
+            return result
+
+        for start in range(0, len(files), _TRASH_BATCH_SIZE):
+            chunk = files[start:start + _TRASH_BATCH_SIZE]
+            batch = []
+            for fi, (outcome, reason) in zip(chunk, executor.map(_verify, [fi.path_str for fi in chunk])):
+                if outcome == "ok":
+                    batch.append(fi)
+                else:
+                    _record(result, fi, outcome, reason)
+            if batch:
+                _trash_batch(result, batch)
 
     return result
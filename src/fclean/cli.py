@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
@@ -11,8 +13,12 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.prompt import Confirm
 
 from fclean import __version__
-from fclean.scanner import FileInfo, ProgressCallback, scan
+from fclean.scanner import FileInfo, ProgressCallback, ScanResult, scan
 from fclean.cleaner import delete_files
+from fclean.rules.age import select_by_age
+from fclean.rules.duplicate import find_duplicates
+from fclean.rules.pattern import filter_by_extension, select_by_pattern
+from fclean.rules.size import select_by_size
 from fclean.reporter import (
     console,
     format_size,
@@ -39,12 +45,22 @@ def _resolve_workers(path: Path, workers: int) -> int:
             return 1
     except (IndexError, OSError):
         pass
-    return 4
+    # Workers share a directory queue, so more threads keep scaling; scan()
+    # caps this on filesystems that lock directory reads per volume (APFS, ZFS)
+    return os.cpu_count() or 4
+
+
+# Minimum seconds between spinner redraws (~30 Hz)
+_PROGRESS_MIN_INTERVAL = 1 / 30
 
 
 @contextmanager
 def _scan_progress():
-    """Yield a progress callback that drives a live Rich spinner."""
+    """Yield a progress callback that drives a live Rich spinner.
+
+    Updates are throttled so redrawing never becomes the bottleneck on fast
+    disks; the latest counts are always flushed before the spinner closes.
+    """
     progress = Progress(
         SpinnerColumn(),
         TextColumn("{task.description}"),
@@ -53,15 +69,29 @@ def _scan_progress():
         transient=True,
     )
     task_id = progress.add_task("Scanning...", total=None)
+    last_update = 0.0
+    pending: tuple[int, int] | None = None
 
-    def callback(file_count: int, total_size: int) -> None:
+    def render(file_count: int, total_size: int) -> None:
         progress.update(
             task_id,
             description=f"Scanning  {file_count:,} files  {format_size(total_size)}",
         )
 
+    def callback(file_count: int, total_size: int) -> None:
+        nonlocal last_update, pending
+        now = time.monotonic()
+        if now - last_update < _PROGRESS_MIN_INTERVAL:
+            pending = (file_count, total_size)
+            return
+        last_update = now
+        pending = None
+        render(file_count, total_size)
+
     with progress:
         yield callback
+        if pending is not None:
+            render(*pending)
 
 
 def version_callback(value: bool) -> None:
@@ -89,7 +119,7 @@ def scan_cmd(
     pattern: Optional[list[str]] = typer.Option(None, "--pattern", "-p", help="Glob patterns to match (e.g. '*.tmp')."),
     skip_hidden: bool = typer.Option(False, "--skip-hidden", help="Skip hidden files and directories."),
     limit: int = typer.Option(20, "--limit", "-n", help="Max files to show in report."),
-    workers: int = typer.Option(0, "--workers", "-w", help="Number of threads (0=auto: 1 for WSL /mnt/, 4 otherwise)."),
+    workers: int = typer.Option(0, "--workers", "-w", help="Number of threads (0=auto: 1 for WSL /mnt/, CPU count otherwise)."),
 ) -> None:
     """Scan a directory and report files matching criteria."""
     if not path.is_dir():
@@ -98,30 +128,16 @@ def scan_cmd(
 
     with _scan_progress() as on_progress:
         result = scan(path, skip_hidden=skip_hidden, on_progress=on_progress, workers=_resolve_workers(path, workers))
-    files = result.files
 
-    # Apply filters
     has_filter = any([older_than, larger_than, smaller_than, pattern])
 
-    if older_than:
-        from fclean.rules.age import filter_by_age
-        files = filter_by_age(files, older_than)
-
-    if larger_than or smaller_than:
-        from fclean.rules.size import filter_by_size
-        files = filter_by_size(files, larger_than=larger_than, smaller_than=smaller_than)
-
-    if pattern:
-        from fclean.rules.pattern import filter_by_pattern
-        files = filter_by_pattern(files, pattern)
-
     if has_filter:
+        files = _select_files(result, older_than, larger_than, smaller_than, pattern)
         print_scan_summary(result)
         console.print()
         print_file_table(files, title="Matched Files", limit=limit)
     else:
         # No filter: show full comprehensive report
-        from fclean.rules.duplicate import find_duplicates
         print_full_report(result, top_size=limit, top_old=limit)
         dupes = find_duplicates(result.files)
         if dupes:
@@ -140,7 +156,7 @@ def clean(
     trash: bool = typer.Option(True, "--trash/--permanent", help="Move to trash (default) or permanently delete. Requires --execute."),
     skip_hidden: bool = typer.Option(False, "--skip-hidden", help="Skip hidden files and directories."),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt. Requires --execute."),
-    workers: int = typer.Option(0, "--workers", "-w", help="Number of threads (0=auto: 1 for WSL /mnt/, 4 otherwise)."),
+    workers: int = typer.Option(0, "--workers", "-w", help="Number of threads (0=auto: 1 for WSL /mnt/, CPU count otherwise)."),
 ) -> None:
     """Show files matching criteria. Use --execute to actually delete them."""
     if config:
@@ -157,25 +173,14 @@ def clean(
 
     with _scan_progress() as on_progress:
         result = scan(path, skip_hidden=skip_hidden, on_progress=on_progress, workers=_resolve_workers(path, workers))
-    files = result.files
-
-    if older_than:
-        from fclean.rules.age import filter_by_age
-        files = filter_by_age(files, older_than)
-
-    if larger_than or smaller_than:
-        from fclean.rules.size import filter_by_size
-        files = filter_by_size(files, larger_than=larger_than, smaller_than=smaller_than)
-
-    if pattern:
-        from fclean.rules.pattern import filter_by_pattern
-        files = filter_by_pattern(files, pattern)
+    files = _select_files(result, older_than, larger_than, smaller_than, pattern)
 
     if not files:
         console.print("[green]No files matched the criteria.[/green]")
         return
 
-    print_file_table(files, title="Files to Delete")
+    total_size = sum(f.size for f in files)
+    print_file_table(files, title="Files to Delete", total_size=total_size)
 
     if not execute:
         console.print("[yellow][DRY RUN] No files were deleted. Use --execute to actually delete.[/yellow]")
@@ -183,7 +188,7 @@ def clean(
 
     if not yes:
         action = "trash" if trash else "permanently delete"
-        if not Confirm.ask(f"\n{action.capitalize()} {len(files)} files ({format_size(sum(f.size for f in files))})?"):
+        if not Confirm.ask(f"\n{action.capitalize()} {len(files)} files ({format_size(total_size)})?"):
             console.print("[dim]Cancelled.[/dim]")
             return
 
@@ -196,12 +201,44 @@ def clean(
         console.print(f"[red]Failed: {len(clean_result.failed)} files.[/red]")
 
 
+def _select_files(
+    result: ScanResult,
+    older_than: str | None,
+    larger_than: str | None,
+    smaller_than: str | None,
+    patterns: list[str] | None,
+) -> list[FileInfo]:
+    """Apply the age/size/pattern filters on the scan's columns.
+
+    Each filter narrows a list of row indices; FileInfo records are built
+    only for the rows that survive all of them.
+    """
+    rows = None
+    if older_than:
+        rows = select_by_age(result, older_than, rows)
+    if larger_than or smaller_than:
+        rows = select_by_size(result, larger_than, smaller_than, rows)
+    if patterns:
+        rows = select_by_pattern(result, patterns, rows)
+    return result.files if rows is None else result.select(rows)
+
+
+def _canonical_path(path: str, realdirs: dict[str, str]) -> str:
+    """Resolve path for de-duplication, resolving each parent directory once.
+
+    Scanned files are never symlinks themselves, so only the directory part
+    needs realpath(); caching it avoids a readlink storm per file.
+    """
+    parent, name = os.path.split(path)
+    real = realdirs.get(parent)
+    if real is None:
+        real = realdirs[parent] = os.path.realpath(parent)
+    return os.path.join(real, name)
+
+
 def _clean_from_config(config_path: Path, *, trash: bool, execute: bool, yes: bool) -> None:
     """Run cleanup using a YAML config file."""
     from fclean.config import CleanConfig, ConfigError
-    from fclean.rules.age import filter_by_age
-    from fclean.rules.size import filter_by_size
-    from fclean.rules.pattern import filter_by_pattern, filter_by_extension
 
     try:
         cfg = CleanConfig.from_file(config_path)
@@ -212,7 +249,10 @@ def _clean_from_config(config_path: Path, *, trash: bool, execute: bool, yes: bo
         console.print("[yellow]No rules found in config.[/yellow]")
         return
 
-    seen_paths: dict[Path, FileInfo] = {}
+    seen_paths: dict[str, FileInfo] = {}
+    realdirs: dict[str, str] = {}
+    # Rules often share roots (~/Downloads, /tmp); walk each tree only once
+    scan_cache: dict[tuple[Path, bool], ScanResult] = {}
     for rule in cfg.rules:
         console.print(f"\n[bold]Rule: {rule.name}[/bold]")
         for p in rule.paths:
@@ -221,20 +261,16 @@ def _clean_from_config(config_path: Path, *, trash: bool, execute: bool, yes: bo
                 console.print(f"  [dim]Skipping {p} (not found)[/dim]")
                 continue
 
-            result = scan(target, skip_hidden=rule.skip_hidden)
-            files = result.files
-
-            if rule.older_than:
-                files = filter_by_age(files, rule.older_than)
-            if rule.larger_than or rule.smaller_than:
-                files = filter_by_size(files, larger_than=rule.larger_than, smaller_than=rule.smaller_than)
-            if rule.patterns:
-                files = filter_by_pattern(files, rule.patterns)
+            key = (target.resolve(), rule.skip_hidden)
+            result = scan_cache.get(key)
+            if result is None:
+                result = scan_cache[key] = scan(target, skip_hidden=rule.skip_hidden)
+            files = _select_files(result, rule.older_than, rule.larger_than, rule.smaller_than, rule.patterns)
             if rule.extensions:
                 files = filter_by_extension(files, rule.extensions)
 
             for f in files:
-                seen_paths[f.path.resolve()] = f
+                seen_paths[_canonical_path(f.path_str, realdirs)] = f
             console.print(f"  {target}: {len(files)} files matched")
 
     all_files = list(seen_paths.values())
@@ -243,7 +279,8 @@ def _clean_from_config(config_path: Path, *, trash: bool, execute: bool, yes: bo
         console.print("\n[green]No files matched any rules.[/green]")
         return
 
-    print_file_table(all_files, title="All Matched Files")
+    total_size = sum(f.size for f in all_files)
+    print_file_table(all_files, title="All Matched Files", total_size=total_size)
 
     if not execute:
         console.print("[yellow][DRY RUN] No files were deleted. Use --execute to actually delete.[/yellow]")
@@ -251,7 +288,7 @@ def _clean_from_config(config_path: Path, *, trash: bool, execute: bool, yes: bo
 
     if not yes:
         action = "trash" if trash else "permanently delete"
-        if not Confirm.ask(f"\n{action.capitalize()} {len(all_files)} files ({format_size(sum(f.size for f in all_files))})?"):
+        if not Confirm.ask(f"\n{action.capitalize()} {len(all_files)} files ({format_size(total_size)})?"):
             console.print("[dim]Cancelled.[/dim]")
             return
 
@@ -267,7 +304,7 @@ def duplicates(
     path: Path = typer.Argument(..., help="Directory to scan for duplicates."),
     min_size: int = typer.Option(1024, "--min-size", help="Minimum file size in bytes."),
     skip_hidden: bool = typer.Option(False, "--skip-hidden", help="Skip hidden files."),
-    workers: int = typer.Option(0, "--workers", "-w", help="Number of threads (0=auto: 1 for WSL /mnt/, 4 otherwise)."),
+    workers: int = typer.Option(0, "--workers", "-w", help="Number of threads (0=auto: 1 for WSL /mnt/, CPU count otherwise)."),
 ) -> None:
     """Find duplicate files."""
     if not path.is_dir():
@@ -277,7 +314,6 @@ def duplicates(
     with _scan_progress() as on_progress:
         result = scan(path, skip_hidden=skip_hidden, on_progress=on_progress, workers=_resolve_workers(path, workers))
 
-    from fclean.rules.duplicate import find_duplicates
     groups = find_duplicates(result.files, min_size=min_size)
     print_duplicate_report(groups)
 
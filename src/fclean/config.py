@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 @dataclass
 class RuleConfig:
@@ -30,39 +38,50 @@ class CleanConfig:
 
     @classmethod
     def from_file(cls, path: Path) -> CleanConfig:
-        """Load configuration from a YAML file."""
+        """Load configuration from a YAML file.
+
+        Parsed files are cached by (path, mtime, size), so loading an
+        unchanged file again skips the YAML parse.
+        """
         try:
-            with open(path) as fh:
-                data = yaml.safe_load(fh)
+            st = os.stat(path)
         except FileNotFoundError:
             raise ConfigError(f"Config file not found: {path}")
-        except yaml.YAMLError as e:
-            raise ConfigError(f"Invalid YAML in {path}: {e}")
-
-        if not data or "rules" not in data:
-            return cls()
-
-        raw_rules = data["rules"]
-        if not isinstance(raw_rules, list):
-            raise ConfigError(f"'rules' must be a list in {path}")
-
-        rules = []
-        for raw in raw_rules:
-            if not isinstance(raw, dict):
-                continue
-            rules.append(
-                RuleConfig(
-                    name=raw.get("name", ""),
-                    paths=raw.get("paths", []),
-                    older_than=raw.get("older_than"),
-                    larger_than=raw.get("larger_than"),
-                    smaller_than=raw.get("smaller_than"),
-                    patterns=raw.get("patterns", []),
-                    extensions=raw.get("extensions", []),
-                    skip_hidden=raw.get("skip_hidden", False),
-                )
+        raw_rules = _load_rules(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        return cls(rules=[
+            RuleConfig(
+                name=raw.get("name", ""),
+                paths=list(raw.get("paths") or []),
+                older_than=raw.get("older_than"),
+                larger_than=raw.get("larger_than"),
+                smaller_than=raw.get("smaller_than"),
+                patterns=list(raw.get("patterns") or []),
+                extensions=list(raw.get("extensions") or []),
+                skip_hidden=raw.get("skip_hidden", False),
             )
-        return cls(rules=rules)
+            for raw in raw_rules
+        ])
+
+
+@lru_cache(maxsize=256)
+def _load_rules(path: str, mtime_ns: int, size: int) -> tuple[dict, ...]:
+    """Parse a config file into its raw rule mappings (cached; don't mutate)."""
+    try:
+        with open(path) as fh:
+            data = yaml.load(fh, Loader=_Loader)
+    except FileNotFoundError:
+        raise ConfigError(f"Config file not found: {path}")
+    except yaml.YAMLError as e:
+        raise ConfigError(f"Invalid YAML in {path}: {e}")
+
+    if not data or "rules" not in data:
+        return ()
+
+    raw_rules = data["rules"]
+    if not isinstance(raw_rules, list):
+        raise ConfigError(f"'rules' must be a list in {path}")
+
+    return tuple(raw for raw in raw_rules if isinstance(raw, dict))
 
 
 class ConfigError(Exception):
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import datetime
+import functools
+import heapq
+
 import humanize
 from rich.console import Console
 from rich.table import Table
@@ -18,18 +22,26 @@ def format_size(size: int) -> str:
 
 
 def format_time(timestamp: float) -> str:
-    import datetime
-    dt = datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).astimezone()
+    # Output has minute resolution, so files modified in the same minute share a cache entry
+    return _format_minute(int(timestamp // 60))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_minute(minute: int) -> str:
+    dt = datetime.datetime.fromtimestamp(minute * 60, tz=datetime.timezone.utc).astimezone()
     return dt.strftime("%Y-%m-%d %H:%M")
 
 
 def print_scan_summary(result: ScanResult) -> None:
     """Print a summary of the scan result."""
+    skipped = f"{result.skipped_safe} safe-skipped"
+    if result.skipped_dirs:
+        skipped += f" (+{result.skipped_dirs} protected dirs)"
     console.print(
         Panel(
             f"[bold]{result.file_count:,}[/bold] files  |  "
             f"[bold]{format_size(result.total_size)}[/bold] total  |  "
-            f"[dim]{result.skipped_safe} safe-skipped, {result.error_count} errors[/dim]",
+            f"[dim]{skipped}, {result.error_count} errors[/dim]",
             title="Scan Result",
         )
     )
@@ -40,8 +52,19 @@ def print_file_table(
     *,
     title: str = "Files",
     limit: int = 20,
+    total_count: int | None = None,
+    total_size: int | None = None,
 ) -> None:
-    """Print a table of files."""
+    """Print a table of files.
+
+    total_count/total_size describe the full set when `files` is only its
+    leading slice (e.g. a precomputed top-N); they default to `files` itself.
+    """
+    if total_count is None:
+        total_count = len(files)
+    if total_size is None:
+        total_size = sum(f.size for f in files)
+
     table = Table(title=title, show_lines=False)
     table.add_column("File", style="cyan", max_width=60, no_wrap=True)
     table.add_column("Size", style="green", justify="right")
@@ -50,22 +73,22 @@ def print_file_table(
     shown = files[:limit]
     for f in shown:
         table.add_row(
-            str(f.path),
+            f.path_str,
             format_size(f.size),
             format_time(f.mtime),
         )
 
-    if len(files) > limit:
+    if total_count > limit:
         table.add_row(
-            f"[dim]... and {len(files) - limit} more[/dim]",
+            f"[dim]... and {total_count - limit} more[/dim]",
             "",
             "",
         )
 
     console.print(table)
     console.print(
-        f"  Total: [bold]{len(files)}[/bold] files, "
-        f"[bold]{format_size(sum(f.size for f in files))}[/bold]"
+        f"  Total: [bold]{total_count}[/bold] files, "
+        f"[bold]{format_size(total_size)}[/bold]"
     )
     console.print()
 
@@ -95,7 +118,7 @@ def print_duplicate_report(groups: list[DuplicateGroup]) -> None:
         table.add_column("Modified", style="yellow")
 
         for j, f in enumerate(group.files, 1):
-            table.add_row(str(j), str(f.path), format_time(f.mtime))
+            table.add_row(str(j), f.path_str, format_time(f.mtime))
 
         console.print(table)
         console.print()
@@ -111,14 +134,22 @@ def print_full_report(
     print_scan_summary(result)
     console.print()
 
-    if not result.files:
+    if not result.file_count:
         console.print("[dim]No files to report.[/dim]")
         return
 
+    # Only the top entries are shown, so select them in O(N log k) over the
+    # size/mtime columns and build FileInfo records just for those
+    count = result.file_count
+    total = result.total_size
+    indices = range(count)
+
     # Top by size
-    by_size = sorted(result.files, key=lambda f: f.size, reverse=True)
-    print_file_table(by_size, title="Largest Files", limit=top_size)
+    top = heapq.nlargest(top_size, indices, key=result.sizes.__getitem__)
+    by_size = [result[i] for i in top]
+    print_file_table(by_size, title="Largest Files", limit=top_size, total_count=count, total_size=total)
 
     # Top by age (oldest)
-    by_age = sorted(result.files, key=lambda f: f.mtime)
-    print_file_table(by_age, title="Oldest Files", limit=top_old)
+    top = heapq.nsmallest(top_old, indices, key=result.mtimes.__getitem__)
+    by_age = [result[i] for i in top]
+    print_file_table(by_age, title="Oldest Files", limit=top_old, total_count=count, total_size=total)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 import time
+from collections.abc import Iterable
 
-from fclean.scanner import FileInfo
+from fclean.scanner import FileInfo, ScanResult
 
 # Supported units: d(ays), w(eeks), m(onths), y(ears)
 _UNIT_SECONDS = {
@@ -15,19 +15,19 @@ _UNIT_SECONDS = {
     "y": 31536000,  # 365 days
 }
 
-_PATTERN = re.compile(r"^(\d+)\s*([dwmy])$", re.IGNORECASE)
-
 
 def parse_age(age_str: str) -> float:
     """Parse an age string like '30d', '6m', '1y' into seconds."""
-    match = _PATTERN.match(age_str.strip())
-    if not match:
+    s = age_str.strip()
+    i = 0
+    while i < len(s) and s[i].isdecimal():
+        i += 1
+    unit = s[i:].lstrip().lower()
+    if i == 0 or unit not in _UNIT_SECONDS:
         raise ValueError(
             f"Invalid age format: '{age_str}'. Use <number><unit> (e.g. 30d, 6m, 1y)"
         )
-    value = int(match.group(1))
-    unit = match.group(2).lower()
-    return value * _UNIT_SECONDS[unit]
+    return int(s[:i]) * _UNIT_SECONDS[unit]
 
 
 def filter_by_age(
@@ -44,9 +44,26 @@ def filter_by_age(
         use_mtime: If True, use modification time. If False, use access time.
     """
     threshold = time.time() - parse_age(older_than)
-    result = []
-    for f in files:
-        ts = f.mtime if use_mtime else f.atime
-        if ts < threshold:
-            result.append(f)
-    return result
+    # Pick the attribute once so the comprehension runs without a per-file branch
+    if use_mtime:
+        return [f for f in files if f.mtime < threshold]
+    return [f for f in files if f.atime < threshold]
+
+
+def select_by_age(
+    result: ScanResult,
+    older_than: str,
+    rows: Iterable[int] | None = None,
+    *,
+    use_mtime: bool = True,
+) -> list[int]:
+    """Like filter_by_age, but over ScanResult columns.
+
+    Returns the indices (of rows, or of every file when rows is None) older
+    than the given age, without building a FileInfo per file.
+    """
+    threshold = time.time() - parse_age(older_than)
+    times = result.mtimes if use_mtime else result.atimes
+    if rows is None:
+        return [i for i, t in enumerate(times) if t < threshold]
+    return [i for i in rows if times[i] < threshold]
@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
+import os
+import re
+from collections.abc import Iterable
 
-from fclean.scanner import FileInfo
+from fclean.scanner import FileInfo, ScanResult
+
+# fnmatch.fnmatch() is case-insensitive where the OS normalizes case (Windows)
+_RE_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
 
 # Common junk file patterns
 DEFAULT_JUNK_PATTERNS = [
@@ -28,6 +35,12 @@ DEFAULT_JUNK_PATTERNS = [
 ]
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Combine glob patterns into a single regex alternation."""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns), _RE_FLAGS)
+
+
 def filter_by_pattern(
     files: list[FileInfo],
     patterns: list[str],
@@ -41,13 +54,32 @@ def filter_by_pattern(
         patterns: Glob patterns to match against filenames.
         exclude: If True, return files NOT matching the patterns.
     """
-    result = []
-    for f in files:
-        name = f.path.name
-        matched = any(fnmatch.fnmatch(name, p) for p in patterns)
-        if matched != exclude:
-            result.append(f)
-    return result
+    if not patterns:
+        return list(files) if exclude else []
+
+    match = _compile_patterns(tuple(patterns)).match
+    if exclude:
+        return [f for f in files if match(f.name) is None]
+    return [f for f in files if match(f.name) is not None]
+
+
+def select_by_pattern(
+    result: ScanResult,
+    patterns: list[str],
+    rows: Iterable[int] | None = None,
+) -> list[int]:
+    """Like filter_by_pattern, but over the ScanResult names column.
+
+    Returns the matching indices (of rows, or of every file when rows is
+    None) without building a FileInfo per file.
+    """
+    if not patterns:
+        return []
+    match = _compile_patterns(tuple(patterns)).match
+    names = result.names
+    if rows is None:
+        return [i for i, name in enumerate(names) if match(name) is not None]
+    return [i for i in rows if match(names[i]) is not None]
 
 
 def filter_by_extension(
@@ -63,10 +95,7 @@ def filter_by_extension(
         extensions: Extensions to match (e.g. ['.tmp', '.log']).
         exclude: If True, return files NOT matching the extensions.
     """
-    ext_set = {e.lower() if e.startswith(".") else f".{e.lower()}" for e in extensions}
-    result = []
-    for f in files:
-        matched = f.path.suffix.lower() in ext_set
-        if matched != exclude:
-            result.append(f)
-    return result
+    ext_set = frozenset(e.lower() if e.startswith(".") else f".{e.lower()}" for e in extensions)
+    if exclude:
+        return [f for f in files if f.suffix_lower not in ext_set]
+    return [f for f in files if f.suffix_lower in ext_set]
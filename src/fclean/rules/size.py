@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import re
+from collections.abc import Iterable
+from operator import attrgetter
 
-from fclean.scanner import FileInfo
+from fclean.scanner import FileInfo, ScanResult
 
 _UNITS = {
     "b": 1,
@@ -14,19 +15,29 @@ _UNITS = {
     "tb": 1024 ** 4,
 }
 
-_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)\s*(b|kb|mb|gb|tb)$", re.IGNORECASE)
+
+def _scan_digits(s: str, i: int) -> int:
+    """Return the index just past the run of decimal digits starting at i."""
+    while i < len(s) and s[i].isdecimal():
+        i += 1
+    return i
 
 
 def parse_size(size_str: str) -> int:
     """Parse a size string like '100MB', '1.5GB' into bytes."""
-    match = _PATTERN.match(size_str.strip())
-    if not match:
+    s = size_str.strip()
+    end = _scan_digits(s, 0)
+    valid = end > 0
+    if valid and end < len(s) and s[end] == ".":
+        frac_end = _scan_digits(s, end + 1)
+        valid = frac_end > end + 1
+        end = frac_end
+    unit = s[end:].lstrip().lower()
+    if not valid or unit not in _UNITS:
         raise ValueError(
             f"Invalid size format: '{size_str}'. Use <number><unit> (e.g. 100MB, 1.5GB)"
         )
-    value = float(match.group(1))
-    unit = match.group(2).lower()
-    return int(value * _UNITS[unit])
+    return int(float(s[:end]) * _UNITS[unit])
 
 
 def filter_by_size(
@@ -41,19 +52,38 @@ def filter_by_size(
         larger_than: Minimum size string (e.g. '100MB').
         smaller_than: Maximum size string (e.g. '1KB').
     """
-    min_bytes = parse_size(larger_than) if larger_than else 0
+    if not larger_than and not smaller_than:
+        # Nothing to filter on; skip the per-file pass (still a new list, like
+        # every other filter, so callers never alias their input)
+        return list(files)
+
+    # -1 / inf sentinels make absent bounds always pass, so one chained
+    # comparison covers every case
+    min_bytes = parse_size(larger_than) if larger_than else -1
     max_bytes = parse_size(smaller_than) if smaller_than else float("inf")
+    return [f for f in files if min_bytes < f.size < max_bytes]
+
+
+def select_by_size(
+    result: ScanResult,
+    larger_than: str | None = None,
+    smaller_than: str | None = None,
+    rows: Iterable[int] | None = None,
+) -> list[int]:
+    """Like filter_by_size, but over ScanResult columns.
 
-    result = []
-    for f in files:
-        if larger_than and f.size <= min_bytes:
-            continue
-        if smaller_than and f.size >= max_bytes:
-            continue
-        result.append(f)
-    return result
+    Returns the matching indices (of rows, or of every file when rows is
+    None) without building a FileInfo per file.
+    """
+    min_bytes = parse_size(larger_than) if larger_than else -1
+    max_bytes = parse_size(smaller_than) if smaller_than else float("inf")
+    sizes = result.sizes
+    if rows is None:
+        return [i for i, size in enumerate(sizes) if min_bytes < size < max_bytes]
+    return [i for i in rows if min_bytes < sizes[i] < max_bytes]
 
 
 def sort_by_size(files: list[FileInfo], *, descending: bool = True) -> list[FileInfo]:
     """Sort files by size."""
-    return sorted(files, key=lambda f: f.size, reverse=descending)
+    # attrgetter runs in C; a lambda key costs a Python frame per file
+    return sorted(files, key=attrgetter("size"), reverse=descending)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import platform
 from pathlib import Path
 
@@ -69,34 +70,48 @@ _SAFE_FILES = {
 }
 
 
-def _get_safe_dirs() -> set[str]:
+def _get_safe_dirs() -> frozenset[str]:
     system = platform.system()
     if system == "Windows":
-        return _SAFE_DIRS_WINDOWS
+        return frozenset(_SAFE_DIRS_WINDOWS)
     if system == "Darwin":
-        return _SAFE_DIRS_MACOS | _SAFE_DIRS_LINUX
-    return _SAFE_DIRS_LINUX
+        return frozenset(_SAFE_DIRS_MACOS | _SAFE_DIRS_LINUX)
+    return frozenset(_SAFE_DIRS_LINUX)
 
 
-def is_safe(path: Path) -> bool:
-    """Check if a path is a protected system file/directory."""
-    resolved = path.resolve()
-    name_lower = resolved.name.lower()
-
-    # Check filename
-    if name_lower in _SAFE_FILES:
-        return True
+# Picked once at import instead of calling platform.system() per check
+_SAFE_DIRS = _get_safe_dirs()
 
-    # Check if inside a safe directory
-    safe_dirs = _get_safe_dirs()
-    for parent in resolved.parents:
-        if parent.name.lower() in safe_dirs and parent.parent == Path(parent.anchor):
-            return True
 
-    # Protect sensitive user directories
+def _in_protected_dir(resolved: Path) -> bool:
+    """Whether a resolved directory is, or is inside, a protected directory."""
     home = Path.home()
-    for parent in resolved.parents:
-        if parent.name in _SENSITIVE_USER_DIRS and parent.parent == home:
+    for d in (resolved, *resolved.parents):
+        # System directories at the filesystem root (parts: anchor, name)
+        if len(d.parts) == 2 and d.name.lower() in _SAFE_DIRS:
+            return True
+        # Sensitive user directories
+        if d.name in _SENSITIVE_USER_DIRS and d.parent == home:
             return True
-
     return False
+
+
+def is_safe_name(name: str) -> bool:
+    """Check if a file name is protected wherever it lives."""
+    return name.lower() in _SAFE_FILES
+
+
+@functools.lru_cache(maxsize=8192)
+def is_safe_dir(dir_path: str) -> bool:
+    """Check if every file directly inside dir_path is protected by location.
+
+    Protection depends only on the directory, so the scanner asks once per
+    directory instead of once per file.
+    """
+    return _in_protected_dir(Path(dir_path).resolve())
+
+
+def is_safe(path: str | Path) -> bool:
+    """Check if a path is a protected system file/directory."""
+    resolved = Path(path).resolve()
+    return is_safe_name(resolved.name) or _in_protected_dir(resolved.parent)
@@ -3,44 +3,75 @@
 from __future__ import annotations
 
 import os
+import queue
+import re
 import stat as stat_mod
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+import threading
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import Callable, Iterable, Iterator
 
-from fclean.safelist import is_safe
+from fclean import _statx
+from fclean.safelist import is_safe, is_safe_dir, is_safe_name
 
 
-@dataclass
+@dataclass(init=False, slots=True)
 class FileInfo:
-    """Metadata for a single file."""
+    """Metadata for a single file.
 
-    path: Path
+    The path is kept as a plain string; `path` builds the Path object on first
+    access, so a scan doesn't pay pathlib construction for every file. Slotted
+    to keep per-record memory small on million-file scans.
+    """
+
+    path_str: str
     size: int = 0
     mtime: float = 0.0  # last modified
     atime: float = 0.0  # last accessed
     ctime: float = 0.0  # created (platform-dependent)
+    name: str = ""  # basename, cached so filter loops skip pathlib
+    suffix_lower: str = ""  # e.g. ".log", or ""
+    _path: Path | None = field(default=None, repr=False, compare=False)
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        size: int = 0,
+        mtime: float = 0.0,
+        atime: float = 0.0,
+        ctime: float = 0.0,
+        name: str = "",
+    ) -> None:
+        self.path_str = os.fspath(path)
+        self._path = path if isinstance(path, Path) else None
+        self.size = size
+        self.mtime = mtime
+        self.atime = atime
+        self.ctime = ctime
+        self.name = name or os.path.basename(self.path_str)
+        self.suffix_lower = _suffix_lower(self.name)
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = Path(self.path_str)
+        return self._path
 
     @classmethod
-    def from_path(cls, path: Path) -> FileInfo | None:
-        """Create FileInfo from a path. Returns None if stat fails."""
+    def from_path(cls, path: str | os.PathLike[str]) -> FileInfo | None:
+        """Create FileInfo from a path. Returns None if stat fails or it isn't a regular file."""
         try:
-            st = path.stat()
-            if not stat_mod.S_ISREG(st.st_mode):
-                return None
-            return cls(
-                path=path,
-                size=st.st_size,
-                mtime=st.st_mtime,
-                atime=st.st_atime,
-                ctime=st.st_ctime,
-            )
+            st = os.stat(path)
         except OSError:
             return None
+        if not stat_mod.S_ISREG(st.st_mode):
+            return None
+        return cls.from_stat(path, st)
 
     @classmethod
-    def from_stat(cls, path: Path, st: os.stat_result) -> FileInfo:
+    def from_stat(cls, path: str | os.PathLike[str], st: os.stat_result, name: str = "") -> FileInfo:
         """Create FileInfo from an already-obtained stat result."""
         return cls(
             path=path,
@@ -48,27 +79,132 @@ class FileInfo:
             mtime=st.st_mtime,
             atime=st.st_atime,
             ctime=st.st_ctime,
+            name=name,
         )
 
 
-@dataclass
+def _suffix_lower(name: str) -> str:
+    """Lowercased final suffix of a filename, with Path.suffix semantics."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
+
+
+@dataclass(slots=True)
 class ScanResult:
-    """Result of a directory scan."""
+    """Result of a directory scan.
+
+    File metadata is stored column-wise (one list/array per field) so whole-scan
+    passes such as top-N by size read packed C numbers instead of touching one
+    object per file. `files` materializes FileInfo records on first access.
+    """
 
-    files: list[FileInfo] = field(default_factory=list)
+    paths: list[str] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array("q"))
+    mtimes: array = field(default_factory=lambda: array("d"))
+    atimes: array = field(default_factory=lambda: array("d"))
+    ctimes: array = field(default_factory=lambda: array("d"))
     total_size: int = 0
     error_count: int = 0
+    # Protected files seen in scanned directories; pruned protected subtrees are not listed
     skipped_safe: int = 0
+    # Protected directories pruned without listing (the root itself counts)
+    skipped_dirs: int = 0
+    _files: list[FileInfo] | None = field(default=None, repr=False, compare=False)
 
     @property
     def file_count(self) -> int:
-        return len(self.files)
+        return len(self.paths)
+
+    def append(self, path: str, name: str, st: os.stat_result) -> None:
+        """Record one file from its stat result."""
+        self.paths.append(path)
+        self.names.append(name)
+        self.sizes.append(st.st_size)
+        self.mtimes.append(st.st_mtime)
+        self.atimes.append(st.st_atime)
+        self.ctimes.append(st.st_ctime)
+        self.total_size += st.st_size
+        self._files = None
+
+    def __getitem__(self, i: int) -> FileInfo:
+        return FileInfo(
+            path=self.paths[i],
+            size=self.sizes[i],
+            mtime=self.mtimes[i],
+            atime=self.atimes[i],
+            ctime=self.ctimes[i],
+            name=self.names[i],
+        )
+
+    def select(self, rows: Iterable[int]) -> list[FileInfo]:
+        """FileInfo records for the given row indices only."""
+        files = self._files
+        if files is not None:
+            return [files[i] for i in rows]
+        return [self[i] for i in rows]
+
+    @property
+    def files(self) -> list[FileInfo]:
+        """All files as FileInfo records (built once, then cached; treat as read-only)."""
+        if self._files is None:
+            self._files = [self[i] for i in range(len(self.paths))]
+        return self._files
 
 
 # (file_count, total_size) -> None
 ProgressCallback = Callable[[int, int], None]
 
-_PROGRESS_INTERVAL = 500
+# Report every 64 files; callers throttle rendering by wall-clock time
+_PROGRESS_INTERVAL = 64
+
+
+# Filesystems that revalidate attributes with the server/host on every stat;
+# statx(AT_STATX_DONT_SYNC) lets them answer from cache. On local disks the
+# ctypes call costs more than DirEntry.stat(), so it is only used here.
+_REMOTE_FS_TYPES = {"9p", "v9fs", "drvfs", "nfs", "nfs4", "cifs", "smb3", "smbfs", "ceph", "lustre"}
+
+
+def _fs_type(path: str | Path) -> str:
+    """Filesystem type of the mount containing path, from /proc/mounts ("" if unknown)."""
+    try:
+        real = os.path.realpath(path)
+        with open("/proc/mounts") as fh:
+            lines = fh.read().splitlines()
+    except OSError:
+        return ""
+    best, fstype = "", ""
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 3:
+            continue
+        # Mount points escape spaces etc. as octal (\040)
+        mnt = re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), parts[1])
+        inside = real == mnt or real.startswith(mnt.rstrip("/") + "/")
+        if inside and len(mnt) >= len(best):
+            best, fstype = mnt, parts[2]
+    return fstype
+
+
+def _use_statx(fstype: str) -> bool:
+    remote = fstype in _REMOTE_FS_TYPES or fstype.startswith("fuse")
+    return remote and _statx.available()
+
+
+# Filesystems that serialize directory reads behind a per-volume/per-dataset
+# lock (APFS getdirentries, ZFS, btrfs tree locks, the Lustre MDS): past ~4
+# threads workers mostly contend on that lock and scans get slower.
+_LOCKED_FS_TYPES = {"apfs", "zfs", "btrfs", "lustre"}
+_LOCKED_FS_MAX_WORKERS = 4
+
+
+def _optimal_workers(fstype: str, requested: int) -> int:
+    """Cap the requested worker count for filesystems with a per-volume lock."""
+    if sys.platform == "darwin" or fstype in _LOCKED_FS_TYPES:
+        return min(requested, _LOCKED_FS_MAX_WORKERS)
+    return requested
 
 
 def scan(
@@ -87,34 +223,77 @@ def scan(
         follow_symlinks: Whether to follow symbolic links.
         skip_hidden: Whether to skip hidden files/directories (starting with '.').
         respect_safelist: Whether to skip system-protected paths.
-        on_progress: Optional callback invoked every ~500 files with (file_count, total_size).
+        on_progress: Optional callback invoked every 64 files with (file_count, total_size).
         workers: Number of threads for parallel scanning. 1 = single-threaded (default).
+            Capped at 4 on filesystems that lock directory reads per volume.
     """
+    fstype = _fs_type(root)
+    use_statx = _use_statx(fstype)
+    workers = _optimal_workers(fstype, workers)
     if workers <= 1:
         return _scan_single(root, follow_symlinks=follow_symlinks, skip_hidden=skip_hidden,
-                            respect_safelist=respect_safelist, on_progress=on_progress)
+                            respect_safelist=respect_safelist, on_progress=on_progress,
+                            use_statx=use_statx)
     return _scan_parallel(root, follow_symlinks=follow_symlinks, skip_hidden=skip_hidden,
-                          respect_safelist=respect_safelist, on_progress=on_progress, workers=workers)
+                          respect_safelist=respect_safelist, on_progress=on_progress, workers=workers,
+                          use_statx=use_statx)
+
+
+def _is_protected(file_path: str, name: str, follow_symlinks: bool) -> bool:
+    """is_safe() for a scanned file whose directory already passed is_safe_dir().
+
+    The walkers prune protected directories, so only the file name is left to
+    check. A followed symlink can point anywhere and still gets the full check.
+    """
+    if follow_symlinks and os.path.islink(file_path):
+        return is_safe(file_path)
+    return is_safe_name(name)
 
 
 def _process_entries(
     result: ScanResult,
-    files: list[tuple[Path, os.stat_result | None]],
+    files: Iterable[tuple[str, str, os.stat_result | None]],
     respect_safelist: bool,
+    follow_symlinks: bool,
     on_progress: ProgressCallback | None,
 ) -> None:
     """Add file entries to result and fire progress callback."""
-    for file_path, st in files:
-        if respect_safelist and is_safe(file_path):
+    # Count down to the next callback instead of a modulo per file; resume
+    # mid-interval when called once per batch
+    remaining = _PROGRESS_INTERVAL - len(result.paths) % _PROGRESS_INTERVAL
+    # Bound once: attribute/global lookups add up on million-file scans.
+    # Columns are appended directly (ScanResult.append inlined) and the size
+    # total is kept local until the batch ends.
+    paths_append = result.paths.append
+    names_append = result.names.append
+    sizes_append = result.sizes.append
+    mtimes_append = result.mtimes.append
+    atimes_append = result.atimes.append
+    ctimes_append = result.ctimes.append
+    is_protected = _is_protected
+    total = 0
+    for file_path, name, st in files:
+        if respect_safelist and is_protected(file_path, name, follow_symlinks):
             result.skipped_safe += 1
             continue
         if st is None:
             result.error_count += 1
             continue
-        result.files.append(FileInfo.from_stat(file_path, st))
-        result.total_size += st.st_size
-        if on_progress and result.file_count % _PROGRESS_INTERVAL == 0:
-            on_progress(result.file_count, result.total_size)
+        size = st.st_size
+        paths_append(file_path)
+        names_append(name)
+        sizes_append(size)
+        mtimes_append(st.st_mtime)
+        atimes_append(st.st_atime)
+        ctimes_append(st.st_ctime)
+        total += size
+        remaining -= 1
+        if remaining == 0:
+            remaining = _PROGRESS_INTERVAL
+            if on_progress:
+                on_progress(len(result.paths), result.total_size + total)
+    result.total_size += total
+    result._files = None
 
 
 def _scan_single(
@@ -124,33 +303,18 @@ def _scan_single(
     skip_hidden: bool,
     respect_safelist: bool,
     on_progress: ProgressCallback | None,
+    use_statx: bool = False,
 ) -> ScanResult:
     """Original single-threaded scan path."""
     result = ScanResult()
-    for file_path, st in _walk_files(root, follow_symlinks=follow_symlinks, skip_hidden=skip_hidden):
-        if respect_safelist and is_safe(file_path):
-            result.skipped_safe += 1
-            continue
-        if st is None:
-            result.error_count += 1
-            continue
-        result.files.append(FileInfo.from_stat(file_path, st))
-        result.total_size += st.st_size
-        if on_progress and result.file_count % _PROGRESS_INTERVAL == 0:
-            on_progress(result.file_count, result.total_size)
-    return result
 
+    def pruned(path: str) -> None:
+        result.skipped_dirs += 1
 
-def _walk_subtree(
-    root: Path,
-    follow_symlinks: bool,
-    skip_hidden: bool,
-) -> list[tuple[Path, os.stat_result | None]]:
-    """Walk a complete subtree, returning all file entries.
-
-    Uses _walk_files internally — safe to call from worker threads.
-    """
-    return list(_walk_files(root, follow_symlinks=follow_symlinks, skip_hidden=skip_hidden))
+    walk = _walk_files(root, follow_symlinks=follow_symlinks, skip_hidden=skip_hidden,
+                       respect_safelist=respect_safelist, use_statx=use_statx, on_prune=pruned)
+    _process_entries(result, walk, respect_safelist, follow_symlinks, on_progress)
+    return result
 
 
 def _scan_parallel(
@@ -161,78 +325,172 @@ def _scan_parallel(
     respect_safelist: bool,
     on_progress: ProgressCallback | None,
     workers: int,
+    use_statx: bool = False,
 ) -> ScanResult:
-    """Multithreaded scan: each worker walks a top-level subtree."""
+    """Multithreaded scan: workers share one queue of directories.
+
+    Each worker lists a single directory at a time and queues the
+    subdirectories it finds, so one huge subtree (e.g. node_modules) is
+    spread across all workers instead of pinning one while the rest idle.
+    Workers also apply the per-file safelist check, so the calling thread
+    only merges batches as they arrive.
+    """
     result = ScanResult()
+    pending: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+    # (files, skipped_safe) per listed directory, or an error raised by a worker
+    found: queue.SimpleQueue[
+        tuple[list[tuple[str, str, os.stat_result | None]], int] | BaseException | None
+    ] = queue.SimpleQueue()
+    lock = threading.Lock()
+    # Directories queued or being listed; the scan is done when it hits zero
+    in_flight = 1
+    skipped_dirs = 0
+    pending.put(os.fspath(root))
+
+    def worker() -> None:
+        nonlocal in_flight, skipped_dirs
+        while True:
+            current = pending.get()
+            if current is None:
+                return
+            try:
+                # Protected subtrees are pruned whole (the finally still
+                # retires this directory)
+                if respect_safelist and is_safe_dir(current):
+                    with lock:
+                        skipped_dirs += 1
+                    continue
+                files, subdirs = _list_dir(current, follow_symlinks, skip_hidden, use_statx)
+                # Count subdirs before queueing them so in_flight can't reach
+                # zero while they are still waiting
+                with lock:
+                    in_flight += len(subdirs)
+                for sd in subdirs:
+                    pending.put(sd)
+                skipped = 0
+                if respect_safelist and files:
+                    kept = [f for f in files if not _is_protected(f[0], f[1], follow_symlinks)]
+                    skipped = len(files) - len(kept)
+                    files = kept
+                if files or skipped:
+                    found.put((files, skipped))
+            except BaseException as exc:
+                # Hand the error to the merging thread and stop the other
+                # workers, or the scan would wait forever on a dead worker
+                found.put(exc)
+                for _ in range(workers):
+                    pending.put(None)
+                return
+            finally:
+                with lock:
+                    in_flight -= 1
+                    finished = in_flight == 0
+                if finished:
+                    found.put(None)
+                    for _ in range(workers):
+                        pending.put(None)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    while (item := found.get()) is not None:
+        if isinstance(item, BaseException):
+            for t in threads:
+                t.join()
+            raise item
+        batch, skipped = item
+        result.skipped_safe += skipped
+        _process_entries(result, batch, False, follow_symlinks, on_progress)
+    for t in threads:
+        t.join()
+    result.skipped_dirs = skipped_dirs
+
+    return result
+
+
+# os.scandir() accepts a directory fd on POSIX (not on Windows)
+_SCANDIR_FD = os.scandir in os.supports_fd
+
 
-    # Phase 1: scan root dir to get root-level files and discover subtrees
-    root_files: list[tuple[Path, os.stat_result | None]] = []
-    subdirs: list[Path] = []
+def _list_dir(
+    current: str,
+    follow_symlinks: bool,
+    skip_hidden: bool,
+    use_statx: bool,
+) -> tuple[list[tuple[str, str, os.stat_result | None]], list[str]]:
+    """List one directory, returning its (path, name, stat) files and subdirs.
+
+    Uses entry.stat() from os.scandir() to avoid a redundant stat() syscall
+    per file — significant on slow filesystems like WSL /mnt/c/. Where
+    supported the directory is opened once and scanned by fd, so those stats
+    are fstatat() calls relative to it instead of re-resolving the full path
+    (and its permission checks) once per file. With use_statx, files are
+    instead statx()'d relative to that fd without forcing an attribute sync
+    (see _REMOTE_FS_TYPES).
+    """
+    files: list[tuple[str, str, os.stat_result | None]] = []
+    subdirs: list[str] = []
+    files_append = files.append
+    subdirs_append = subdirs.append
+    fast_stat = _statx.fast_stat
+    fsencode = os.fsencode
+    # Entries scanned by fd carry a bare name as .path, so build paths here
+    prefix = current if current.endswith("/") else current + "/"
+    dirfd = -1
     try:
-        with os.scandir(root) as entries:
+        if _SCANDIR_FD:
+            dirfd = os.open(current, os.O_RDONLY | os.O_DIRECTORY)
+        with os.scandir(dirfd if dirfd >= 0 else current) as entries:
             for entry in entries:
-                if skip_hidden and entry.name.startswith("."):
+                name = entry.name
+                if skip_hidden and name[:1] == ".":
                     continue
+                path = prefix + name if dirfd >= 0 else entry.path
                 try:
                     if entry.is_dir(follow_symlinks=follow_symlinks):
-                        subdirs.append(Path(entry.path))
+                        subdirs_append(path)
                     elif entry.is_file(follow_symlinks=follow_symlinks):
                         try:
-                            st = entry.stat(follow_symlinks=follow_symlinks)
+                            if use_statx:
+                                st = fast_stat(dirfd, fsencode(name), follow_symlinks=follow_symlinks)
+                            else:
+                                st = entry.stat(follow_symlinks=follow_symlinks)
                         except OSError:
                             st = None
-                        root_files.append((Path(entry.path), st))
+                        files_append((path, name, st))
                 except OSError:
                     continue
     except OSError:
         pass
-
-    _process_entries(result, root_files, respect_safelist, on_progress)
-
-    if not subdirs:
-        return result
-
-    # Phase 2: walk each subtree in parallel
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = [
-            executor.submit(_walk_subtree, sd, follow_symlinks, skip_hidden)
-            for sd in subdirs
-        ]
-        for future in as_completed(futures):
-            _process_entries(result, future.result(), respect_safelist, on_progress)
-
-    return result
+    finally:
+        if dirfd >= 0:
+            os.close(dirfd)
+    return files, subdirs
 
 
 def _walk_files(
-    root: Path,
+    root: str | Path,
     *,
     follow_symlinks: bool = False,
     skip_hidden: bool = False,
-) -> Iterator[tuple[Path, os.stat_result | None]]:
-    """Yield (path, stat_result) pairs under root using iterative DFS.
-
-    Uses entry.stat() from os.scandir() to avoid a redundant stat() syscall
-    per file — significant on slow filesystems like WSL /mnt/c/.
+    respect_safelist: bool = False,
+    use_statx: bool = False,
+    on_prune: Callable[[str], None] | None = None,
+) -> Iterator[tuple[str, str, os.stat_result | None]]:
+    """Yield (path, name, stat_result) tuples under root using iterative DFS.
+
+    Paths stay plain strings end-to-end (scandir accepts and returns str), so
+    no Path object is built per directory or file. With respect_safelist,
+    protected directories are skipped without being listed and passed to
+    on_prune.
     """
-    stack = [root]
+    stack = [os.fspath(root)]
     while stack:
         current = stack.pop()
-        try:
-            with os.scandir(current) as entries:
-                for entry in entries:
-                    if skip_hidden and entry.name.startswith("."):
-                        continue
-                    try:
-                        if entry.is_dir(follow_symlinks=follow_symlinks):
-                            stack.append(Path(entry.path))
-                        elif entry.is_file(follow_symlinks=follow_symlinks):
-                            try:
-                                st = entry.stat(follow_symlinks=follow_symlinks)
-                            except OSError:
-                                st = None
-                            yield Path(entry.path), st
-                    except OSError:
-                        continue
-        except OSError:
+        if respect_safelist and is_safe_dir(current):
+            if on_prune is not None:
+                on_prune(current)
             continue
+        files, subdirs = _list_dir(current, follow_symlinks, skip_hidden, use_statx)
+        stack.extend(subdirs)
+        yield from files
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import platform
-import stat
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import Callable
 
 import platformdirs
 
@@ -22,27 +25,43 @@ class SuggestItem:
     file_count: int = 0
 
 
-def _dir_stats(path: Path) -> tuple[int, int]:
-    """Return (total_size, file_count) for a directory."""
-    import os
+def _dir_stats(path: Path) -> tuple[int, int] | None:
+    """Return (total_size, file_count) for a directory, or None if it can't be listed.
+
+    Iterative scandir DFS like the scanner's walker: entry types come from the
+    directory listing, so each file costs at most one stat (none on Windows,
+    where scandir returns the stat data with the listing). Opening the root
+    doubles as the existence check, so callers need no separate exists().
+    """
     total_size = 0
     count = 0
-    try:
-        for dirpath, _dirnames, filenames in os.walk(path, followlinks=False):
-            for fname in filenames:
-                try:
-                    fpath = os.path.join(dirpath, fname)
-                    st = os.lstat(fpath)
-                    if stat.S_ISREG(st.st_mode):
-                        total_size += st.st_size
-                        count += 1
-                except OSError:
-                    pass
-    except OSError:
-        pass
+    root = os.fspath(path)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            if current is root:
+                return None
+            continue
+        try:
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            count += 1
+                    except OSError:
+                        pass
+        except OSError:
+            pass
     return total_size, count
 
 
+@cache
 def _is_wsl() -> bool:
     """Detect if running inside WSL."""
     try:
@@ -51,8 +70,9 @@ def _is_wsl() -> bool:
         return False
 
 
-def _wsl_win_homes() -> list[Path]:
-    """Return Windows user home directories accessible via /mnt/c/Users."""
+@cache
+def _wsl_win_homes() -> tuple[Path, ...]:
+    """Return Windows user home directories accessible via /mnt/c/Users (looked up once)."""
     users_dir = Path("/mnt/c/Users")
     skip = {"All Users", "Default", "Default User", "Public", "WsiAccount", "desktop.ini"}
     homes = []
@@ -63,68 +83,83 @@ def _wsl_win_homes() -> list[Path]:
             homes.append(entry)
     except OSError:
         pass
-    return homes
+    return tuple(homes)
+
+
+# Target tables, built once at import: (name, path factory, description).
+# Factories take (home, cache_dir) so per-user paths still resolve per call.
+_SYSTEM = platform.system()
+
+_WINDOWS_TARGETS: tuple[tuple[str, Callable[[Path, Path], Path], str], ...] = (
+    ("User Cache", lambda home, cache: cache, "Application cache files"),
+    ("Temp Files", lambda home, cache: Path(platformdirs.user_data_dir()).parent / "Temp", "Temporary files"),
+    ("Windows Temp", lambda home, cache: home / "AppData" / "Local" / "Temp", "Windows temporary files"),
+    ("Thumbnail Cache", lambda home, cache: home / "AppData" / "Local" / "Microsoft" / "Windows" / "Explorer", "Windows thumbnail cache"),
+    ("Recent Files", lambda home, cache: home / "AppData" / "Roaming" / "Microsoft" / "Windows" / "Recent", "Recent file shortcuts"),
+    ("Chrome Cache", lambda home, cache: home / "AppData" / "Local" / "Google" / "Chrome" / "User Data" / "Default" / "Cache", "Google Chrome browser cache"),
+)
+
+_POSIX_TARGETS: tuple[tuple[str, Callable[[Path, Path], Path], str], ...] = (
+    ("User Cache", lambda home, cache: cache, "Application cache files"),
+    ("Temp Files", lambda home, cache: Path("/tmp"), "Temporary files"),
+    ("Trash", lambda home, cache: home / ".local" / "share" / "Trash", "Trash / Recycle bin"),
+    ("Thumbnail Cache", lambda home, cache: home / ".cache" / "thumbnails", "Image thumbnail cache"),
+    ("Journal Logs", lambda home, cache: Path("/var/log/journal"), "Systemd journal logs"),
+    ("Chrome Cache", lambda home, cache: cache / "google-chrome", "Google Chrome browser cache"),
+)
+
+# WSL: Windows cleanup targets per user home under /mnt/c/Users
+# (name, path parts relative to that home, description)
+_WSL_USER_TARGETS: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("Temp", ("AppData", "Local", "Temp"), "Windows user temp files"),
+    ("npm cache", ("AppData", "Roaming", "npm-cache"), "npm package cache"),
+    ("pip cache", ("AppData", "Local", "pip", "cache"), "pip package cache"),
+    ("Thumbnails", ("AppData", "Local", "Microsoft", "Windows", "Explorer"), "Windows thumbnail cache"),
+    ("Recent", ("AppData", "Roaming", "Microsoft", "Windows", "Recent"), "Recent file shortcuts"),
+    ("Chrome Cache", ("AppData", "Local", "Google", "Chrome", "User Data", "Default", "Cache"), "Chrome browser cache"),
+    ("Edge Cache", ("AppData", "Local", "Microsoft", "Edge", "User Data", "Default", "Cache"), "Edge browser cache"),
+    ("CrashDumps", ("AppData", "Local", "CrashDumps"), "Windows crash dump files"),
+)
 
 
 def get_suggestions() -> list[SuggestItem]:
-    """Get a list of cleanup suggestions for the current OS."""
-    targets: list[tuple[str, Path, str]] = []
-    system = platform.system()
+    """Get a list of cleanup suggestions for the current OS.
+
+    Measurements are cached per (OS, home directory) for the life of the
+    process; call clear_suggestions_cache() to measure again.
+    """
+    return [replace(item) for item in _suggestions(_SYSTEM, Path.home())]
 
-    # Cross-platform
+
+def clear_suggestions_cache() -> None:
+    """Forget cached get_suggestions() results."""
+    _suggestions.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _suggestions(system: str, home: Path) -> tuple[SuggestItem, ...]:
     cache_dir = Path(platformdirs.user_cache_dir())
-    targets.append(("User Cache", cache_dir, "Application cache files"))
-
-    temp_dir = Path(platformdirs.user_data_dir()).parent / "Temp" if system == "Windows" else Path("/tmp")
-    targets.append(("Temp Files", temp_dir, "Temporary files"))
-
-    home = Path.home()
-
-    if system == "Windows":
-        local = home / "AppData" / "Local"
-        targets.extend([
-            ("Windows Temp", local / "Temp", "Windows temporary files"),
-            ("Thumbnail Cache", local / "Microsoft" / "Windows" / "Explorer", "Windows thumbnail cache"),
-            ("Recent Files", home / "AppData" / "Roaming" / "Microsoft" / "Windows" / "Recent", "Recent file shortcuts"),
-        ])
-    else:
-        targets.extend([
-            ("Trash", home / ".local" / "share" / "Trash", "Trash / Recycle bin"),
-            ("Thumbnail Cache", home / ".cache" / "thumbnails", "Image thumbnail cache"),
-            ("Journal Logs", Path("/var/log/journal"), "Systemd journal logs"),
-        ])
-
-    # Browser caches (cross-platform common paths)
-    chrome_cache = cache_dir / "google-chrome" if system != "Windows" else home / "AppData" / "Local" / "Google" / "Chrome" / "User Data" / "Default" / "Cache"
-    targets.append(("Chrome Cache", chrome_cache, "Google Chrome browser cache"))
-
-    # WSL: add Windows cleanup targets under /mnt/c/
+    table = _WINDOWS_TARGETS if system == "Windows" else _POSIX_TARGETS
+    targets = [(name, factory(home, cache_dir), desc) for name, factory, desc in table]
+
     if _is_wsl():
         targets.append(("Windows Temp", Path("/mnt/c/Windows/Temp"), "Windows system temp files"))
-        for wh in _wsl_win_homes():
-            prefix = wh.name
-            local = wh / "AppData" / "Local"
-            roaming = wh / "AppData" / "Roaming"
-            targets.extend([
-                (f"[{prefix}] Temp", local / "Temp", "Windows user temp files"),
-                (f"[{prefix}] npm cache", roaming / "npm-cache", "npm package cache"),
-                (f"[{prefix}] pip cache", local / "pip" / "cache", "pip package cache"),
-                (f"[{prefix}] Thumbnails", local / "Microsoft" / "Windows" / "Explorer", "Windows thumbnail cache"),
-                (f"[{prefix}] Recent", roaming / "Microsoft" / "Windows" / "Recent", "Recent file shortcuts"),
-                (f"[{prefix}] Chrome Cache", local / "Google" / "Chrome" / "User Data" / "Default" / "Cache", "Chrome browser cache"),
-                (f"[{prefix}] Edge Cache", local / "Microsoft" / "Edge" / "User Data" / "Default" / "Cache", "Edge browser cache"),
-                (f"[{prefix}] CrashDumps", local / "CrashDumps", "Windows crash dump files"),
-            ])
-
+        targets.extend(
+            (f"[{wh.name}] {name}", wh.joinpath(*parts), desc)
+            for wh in _wsl_win_homes()
+            for name, parts, desc in _WSL_USER_TARGETS
+        )
+
+    # Targets are independent and the walks are syscall-bound (GIL released),
+    # so total latency becomes the slowest walk rather than the sum
     results = []
-    for name, path, desc in targets:
-        item = SuggestItem(name=name, path=path, description=desc)
-        try:
-            if path.exists():
-                item.exists = True
-                item.size, item.file_count = _dir_stats(path)
-        except OSError:
-            pass
-        results.append(item)
-
-    return [item for item in results if item.exists and item.file_count > 0]
+    max_workers = min(len(targets), (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for (name, path, desc), stats in zip(targets, executor.map(_dir_stats, [t[1] for t in targets])):
+            if stats is None:
+                continue
+            size, count = stats
+            if count > 0:
+                results.append(SuggestItem(name=name, path=path, description=desc,
+                                           exists=True, size=size, file_count=count))
+    return tuple(results)
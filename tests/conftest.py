@@ -0,0 +1,86 @@
+"""Shared test helpers."""
+
+from __future__ import annotations
+
+import inspect
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+import typer
+from rich.console import Console
+from typer.models import ParameterInfo
+
+
+@pytest.fixture(autouse=True)
+def _plain_console(monkeypatch):
+    """Render Rich output as plain fixed-width text while testing.
+
+    Skips terminal size and color probing, and keeps table rows from
+    wrapping differently depending on the terminal running the tests.
+    """
+    plain = Console(width=120, color_system=None, force_terminal=False, highlight=False)
+    monkeypatch.setattr("fclean.reporter.console", plain)
+    monkeypatch.setattr("fclean.cli.console", plain)
+
+
+@dataclass
+class DirectResult:
+    """Mirrors the CliRunner result fields the tests assert on."""
+
+    exit_code: int
+    output: str
+
+
+@pytest.fixture
+def invoke(capsys) -> Callable[..., DirectResult]:
+    """Call a CLI command function in-process, skipping Click's argv dispatch.
+
+    Options not passed fall back to their Typer defaults, and typer.Exit is
+    turned into exit_code. Argument parsing itself is covered by the
+    CliRunner tests in test_cli.py.
+    """
+
+    def call(command: Callable[..., Any], *args: Any, **kwargs: Any) -> DirectResult:
+        params = list(inspect.signature(command).parameters.values())
+        for param in params[len(args):]:
+            if param.name not in kwargs and isinstance(param.default, ParameterInfo):
+                kwargs[param.name] = param.default.default
+        try:
+            command(*args, **kwargs)
+            exit_code = 0
+        except typer.Exit as exc:
+            exit_code = exc.exit_code
+        return DirectResult(exit_code=exit_code, output=capsys.readouterr().out)
+
+    return call
+
+
+@pytest.fixture(scope="session")
+def sample_tree(tmp_path_factory) -> Path:
+    """A small read-only tree built once per session.
+
+    5 regular files (2009 bytes): small.txt (2), big.bin (2000),
+    .hidden.txt (1), logs/a.log (3), logs/b.log (3); plus link.txt, a
+    symlink to small.txt. Tests that modify files use mutable_tree.
+    """
+    root = tmp_path_factory.mktemp("sample")
+    (root / "small.txt").write_bytes(b"hi")
+    (root / "big.bin").write_bytes(b"x" * 2000)
+    (root / ".hidden.txt").write_bytes(b"h")
+    logs = root / "logs"
+    logs.mkdir()
+    (logs / "a.log").write_bytes(b"aaa")
+    (logs / "b.log").write_bytes(b"bbb")
+    (root / "link.txt").symlink_to("small.txt")
+    return root
+
+
+@pytest.fixture
+def mutable_tree(sample_tree, tmp_path) -> Path:
+    """A private copy of sample_tree that a test may modify."""
+    dest = tmp_path / "tree"
+    shutil.copytree(sample_tree, dest, symlinks=True)
+    return dest
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import errno
+import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -77,7 +79,7 @@ class TestDeleteFilesTrash:
         with patch("fclean.cleaner.send2trash") as mock_trash:
             result = delete_files([info], use_trash=True, dry_run=False)
 
-        mock_trash.assert_called_once_with(str(f))
+        mock_trash.assert_called_once_with([str(f)])
         assert result.deleted == [f]
         assert result.total_freed == 4
         assert result.failed == []
@@ -177,3 +179,123 @@ class TestDeleteFilesEdgeCases:
 
         assert result.deleted == [f]
         assert result.total_freed == 0
+
+    def test_symlink_skipped(self, tmp_path):
+        real = tmp_path / "real.txt"
+        real.write_text("keep")
+        link = tmp_path / "link.txt"
+        link.symlink_to(real)
+
+        result = delete_files([make_file_info(link)], use_trash=False, dry_run=False)
+
+        assert link.exists()
+        assert real.exists()
+        assert result.skipped == [(link, "symlink")]
+
+    def test_directory_skipped(self, tmp_path):
+        d = tmp_path / "was_a_file"
+        d.mkdir()
+
+        result = delete_files([make_file_info(d)], use_trash=False, dry_run=False)
+
+        assert d.exists()
+        assert result.skipped == [(d, "no longer a regular file")]
+
+
+class TestDeleteFilesBatching:
+    def test_trash_batches_many_files(self, tmp_path):
+        infos = []
+        for i in range(300):
+            p = tmp_path / f"file{i}.txt"
+            p.write_text("x")
+            infos.append(make_file_info(p, size=1))
+
+        with patch("fclean.cleaner.send2trash") as mock_trash:
+            result = delete_files(infos, use_trash=True, dry_run=False)
+
+        assert mock_trash.call_count == 2  # 256 + 44
+        assert len(result.deleted) == 300
+        assert result.total_freed == 300
+
+    def test_trash_batch_failure_attributed_per_file(self, tmp_path):
+        good = tmp_path / "good.txt"
+        bad = tmp_path / "bad.txt"
+        good.write_text("ok")
+        bad.write_text("no")
+
+        def fake_trash(paths):
+            if isinstance(paths, list) or paths == str(bad):
+                raise OSError("Trash error")
+
+        with patch("fclean.cleaner.send2trash", side_effect=fake_trash):
+            result = delete_files(
+                [make_file_info(good), make_file_info(bad)], use_trash=True, dry_run=False
+            )
+
+        assert result.deleted == [good]
+        assert [p for p, _ in result.failed] == [bad]
+
+    def test_trash_batch_partial_progress_counted(self, tmp_path):
+        first = tmp_path / "first.txt"
+        gone = tmp_path / "gone.txt"
+        last = tmp_path / "last.txt"
+        for p in (first, gone, last):
+            p.write_text("x")
+        infos = [make_file_info(p, size=1) for p in (first, gone, last)]
+        gone.unlink()  # disappears between the re-check and send2trash
+
+        def fake_trash(paths):
+            for path in paths if isinstance(paths, list) else [paths]:
+                if not os.path.lexists(path):
+                    raise OSError(errno.ENOENT, f"File not found: {path}")
+                os.unlink(path)
+
+        with (
+            patch("fclean.cleaner._verify", return_value=("ok", "")),
+            patch("fclean.cleaner.send2trash", side_effect=fake_trash),
+        ):
+            result = delete_files(infos, use_trash=True, dry_run=False)
+
+        assert result.deleted == [first, last]
+        assert [p for p, _ in result.failed] == [gone]
+        assert result.total_freed == 2
+
+    @pytest.mark.parametrize("make_error", [
+        # Linux trash backend: the failing path as bytes
+        lambda paths, path: OSError(errno.EACCES, "Permission denied", os.fsencode(path)),
+        # Windows backends: the whole batch as filename
+        lambda paths, path: OSError(None, None, paths, -2147024891),
+    ])
+    def test_trash_batch_error_filename_forms(self, tmp_path, make_error):
+        first = tmp_path / "first.txt"
+        locked = tmp_path / "locked.txt"
+        last = tmp_path / "last.txt"
+        for p in (first, locked, last):
+            p.write_text("x")
+        infos = [make_file_info(p, size=1) for p in (first, locked, last)]
+
+        def fake_trash(paths):
+            batch = paths if isinstance(paths, list) else [paths]
+            for path in batch:
+                if path == str(locked):
+                    raise make_error(paths, path)
+                os.unlink(path)
+
+        with patch("fclean.cleaner.send2trash", side_effect=fake_trash):
+            result = delete_files(infos, use_trash=True, dry_run=False)
+
+        assert result.deleted == [first, last]
+        assert [p for p, _ in result.failed] == [locked]
+        assert result.total_freed == 2
+
+    def test_permanent_parallel_preserves_order(self, tmp_path):
+        infos = []
+        for i in range(50):
+            p = tmp_path / f"file{i:02d}.txt"
+            p.write_text("x")
+            infos.append(make_file_info(p, size=1))
+
+        result = delete_files(infos, use_trash=False, dry_run=False, max_workers=8)
+
+        assert result.deleted == [fi.path for fi in infos]
+        assert not any(fi.path.exists() for fi in infos)
@@ -1,5 +1,6 @@
 """Tests for CLI commands."""
 
+import pytest
 from typer.testing import CliRunner
 
 from fclean.cli import app
@@ -58,6 +59,7 @@ class TestCLI:
         result = runner.invoke(app, ["duplicates", str(tmp_path)])
         assert result.exit_code == 0
 
+    @pytest.mark.slow
     def test_suggest_command(self):
         result = runner.invoke(app, ["suggest"])
         assert result.exit_code == 0
@@ -3,110 +3,92 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from typer.testing import CliRunner
 
-from fclean.cli import app
-
-runner = CliRunner()
+from fclean.cli import clean, duplicates, scan_cmd
+from fclean.scanner import scan
 
 
 class TestScanEdgeCases:
-    def test_scan_empty_dir(self, tmp_path):
-        result = runner.invoke(app, ["scan", str(tmp_path)])
+    def test_scan_empty_dir(self, tmp_path, invoke):
+        result = invoke(scan_cmd, tmp_path)
         assert result.exit_code == 0
 
-    def test_scan_skip_hidden(self, tmp_path):
-        (tmp_path / "visible.txt").write_text("v")
-        (tmp_path / ".hidden.txt").write_text("h")
-        result = runner.invoke(app, ["scan", str(tmp_path), "--skip-hidden"])
+    def test_scan_skip_hidden(self, sample_tree, invoke):
+        result = invoke(scan_cmd, sample_tree, skip_hidden=True)
         assert result.exit_code == 0
 
-    def test_scan_with_pattern(self, tmp_path):
-        (tmp_path / "a.tmp").write_text("junk")
-        (tmp_path / "b.txt").write_text("keep")
-        result = runner.invoke(app, ["scan", str(tmp_path), "--pattern", "*.tmp"])
+    def test_scan_with_pattern(self, sample_tree, invoke):
+        result = invoke(scan_cmd, sample_tree, pattern=["*.log"])
         assert result.exit_code == 0
 
-    def test_scan_with_smaller_than(self, tmp_path):
-        (tmp_path / "small.txt").write_text("hi")
-        result = runner.invoke(app, ["scan", str(tmp_path), "--smaller-than", "1KB"])
+    def test_scan_with_smaller_than(self, sample_tree, invoke):
+        result = invoke(scan_cmd, sample_tree, smaller_than="1KB")
         assert result.exit_code == 0
 
-    def test_scan_limit_option(self, tmp_path):
+    def test_scan_limit_option(self, tmp_path, invoke):
         for i in range(5):
             (tmp_path / f"file{i}.txt").write_text(f"content{i}")
-        result = runner.invoke(app, ["scan", str(tmp_path), "--limit", "2"])
+        result = invoke(scan_cmd, tmp_path, limit=2)
         assert result.exit_code == 0
 
-    def test_scan_combined_filters(self, tmp_path):
-        (tmp_path / "big.log").write_text("x" * 2000)
-        result = runner.invoke(
-            app,
-            ["scan", str(tmp_path), "--larger-than", "1KB", "--pattern", "*.log"],
-        )
+    def test_scan_combined_filters(self, sample_tree, invoke):
+        result = invoke(scan_cmd, sample_tree, larger_than="1KB", pattern=["*.bin"])
         assert result.exit_code == 0
 
-    def test_scan_file_path_fails(self, tmp_path):
+    def test_scan_reports_protected_root(self, sample_tree, invoke, monkeypatch):
+        monkeypatch.setattr("fclean.scanner.is_safe_dir", lambda d: True)
+        result = invoke(scan_cmd, sample_tree)
+        assert result.exit_code == 0
+        assert "+1 protected dirs" in result.output
+
+    def test_scan_file_path_fails(self, tmp_path, invoke):
         f = tmp_path / "file.txt"
         f.write_text("hi")
-        result = runner.invoke(app, ["scan", str(f)])
+        result = invoke(scan_cmd, f)
         assert result.exit_code == 1
 
 
 class TestCleanEdgeCases:
-    def test_clean_with_older_than(self, tmp_path):
+    def test_clean_with_older_than(self, tmp_path, invoke):
         (tmp_path / "old.txt").write_text("old")
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--older-than", "30d"],
-        )
+        result = invoke(clean, tmp_path, older_than="30d")
         assert result.exit_code == 0
 
-    def test_clean_with_larger_than(self, tmp_path):
-        (tmp_path / "big.bin").write_bytes(b"x" * 2000)
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--larger-than", "1KB"],
-        )
+    def test_clean_with_larger_than(self, sample_tree, invoke):
+        result = invoke(clean, sample_tree, larger_than="1KB")
         assert result.exit_code == 0
+        assert (sample_tree / "big.bin").exists()
 
-    def test_clean_no_files_matched(self, tmp_path):
+    def test_clean_no_files_matched(self, tmp_path, invoke):
         (tmp_path / "file.txt").write_text("hello")
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--pattern", "*.tmp"],
-        )
+        result = invoke(clean, tmp_path, pattern=["*.tmp"])
         assert result.exit_code == 0
         assert "No files matched" in result.output
 
-    def test_clean_file_path_fails(self, tmp_path):
+    def test_clean_file_path_fails(self, tmp_path, invoke):
         f = tmp_path / "file.txt"
         f.write_text("hi")
-        result = runner.invoke(app, ["clean", str(f), "--pattern", "*.txt"])
+        result = invoke(clean, f, pattern=["*.txt"])
         assert result.exit_code == 1
 
-    def test_clean_permanent_dry_run(self, tmp_path):
+    def test_clean_permanent_dry_run(self, tmp_path, invoke):
         (tmp_path / "a.tmp").write_text("junk")
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--pattern", "*.tmp", "--permanent"],
-        )
+        result = invoke(clean, tmp_path, pattern=["*.tmp"], trash=False)
         assert result.exit_code == 0
         assert "DRY RUN" in result.output
 
-    def test_clean_yes_flag_skips_prompt(self, tmp_path):
-        (tmp_path / "junk.tmp").write_text("junk")
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--pattern", "*.tmp", "--execute", "--yes", "--permanent"],
-        )
+    def test_clean_yes_flag_skips_prompt(self, mutable_tree, invoke):
+        result = invoke(clean, mutable_tree, pattern=["*.log"], execute=True, yes=True, trash=False)
         assert result.exit_code == 0
+        assert not (mutable_tree / "logs" / "a.log").exists()
+        assert (mutable_tree / "small.txt").exists()
 
 
 class TestCleanFromConfig:
-    def test_config_clean_dry_run(self, tmp_path):
+    def test_config_clean_dry_run(self, tmp_path, invoke):
         log_dir = tmp_path / "logs"
         log_dir.mkdir()
         (log_dir / "old.log").write_text("old log data")
@@ -121,25 +103,19 @@ class TestCleanFromConfig:
             f"      - '*.log'\n"
         )
 
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--config", str(config)],
-        )
+        result = invoke(clean, tmp_path, config=config)
         assert result.exit_code == 0
         assert "DRY RUN" in result.output
 
-    def test_config_no_rules(self, tmp_path):
+    def test_config_no_rules(self, tmp_path, invoke):
         config = tmp_path / "empty.yaml"
         config.write_text("rules: []\n")
 
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--config", str(config)],
-        )
+        result = invoke(clean, tmp_path, config=config)
         assert result.exit_code == 0
         assert "No rules" in result.output
 
-    def test_config_nonexistent_path_skipped(self, tmp_path):
+    def test_config_nonexistent_path_skipped(self, tmp_path, invoke):
         config = tmp_path / "clean.yaml"
         config.write_text(
             "rules:\n"
@@ -150,13 +126,10 @@ class TestCleanFromConfig:
             "      - '*.tmp'\n"
         )
 
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--config", str(config)],
-        )
+        result = invoke(clean, tmp_path, config=config)
         assert result.exit_code == 0
 
-    def test_config_no_files_matched(self, tmp_path):
+    def test_config_no_files_matched(self, tmp_path, invoke):
         target = tmp_path / "target"
         target.mkdir()
         (target / "keep.txt").write_text("keep")
@@ -171,14 +144,11 @@ class TestCleanFromConfig:
             f"      - '*.tmp'\n"
         )
 
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--config", str(config)],
-        )
+        result = invoke(clean, tmp_path, config=config)
         assert result.exit_code == 0
         assert "No files matched" in result.output
 
-    def test_config_with_older_than_filter(self, tmp_path):
+    def test_config_with_older_than_filter(self, tmp_path, invoke):
         target = tmp_path / "target"
         target.mkdir()
         (target / "a.log").write_text("data")
@@ -194,13 +164,10 @@ class TestCleanFromConfig:
             f"      - '*.log'\n"
         )
 
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--config", str(config)],
-        )
+        result = invoke(clean, tmp_path, config=config)
         assert result.exit_code == 0
 
-    def test_config_with_extension_filter(self, tmp_path):
+    def test_config_with_extension_filter(self, tmp_path, invoke):
         target = tmp_path / "target"
         target.mkdir()
         (target / "a.bak").write_text("backup")
@@ -216,14 +183,11 @@ class TestCleanFromConfig:
             f"      - .bak\n"
         )
 
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--config", str(config)],
-        )
+        result = invoke(clean, tmp_path, config=config)
         assert result.exit_code == 0
         assert "DRY RUN" in result.output
 
-    def test_config_with_size_filter(self, tmp_path):
+    def test_config_with_size_filter(self, tmp_path, invoke):
         target = tmp_path / "target"
         target.mkdir()
         (target / "big.bin").write_bytes(b"x" * 2000)
@@ -238,55 +202,95 @@ class TestCleanFromConfig:
             f"    larger_than: 1KB\n"
         )
 
-        result = runner.invoke(
-            app,
-            ["clean", str(tmp_path), "--config", str(config)],
-        )
+        result = invoke(clean, tmp_path, config=config)
         assert result.exit_code == 0
         assert "DRY RUN" in result.output
 
+    def test_config_shared_path_scanned_once(self, tmp_path, invoke):
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "a.log").write_text("log")
+        (target / "b.tmp").write_text("tmp")
+
+        config = tmp_path / "clean.yaml"
+        config.write_text(
+            f"rules:\n"
+            f"  - name: Logs\n"
+            f"    paths:\n"
+            f"      - {target}\n"
+            f"    patterns:\n"
+            f"      - '*.log'\n"
+            f"  - name: Temp\n"
+            f"    paths:\n"
+            f"      - {target}\n"
+            f"    patterns:\n"
+            f"      - '*.tmp'\n"
+        )
+
+        with patch("fclean.cli.scan", wraps=scan) as mock_scan:
+            result = invoke(clean, tmp_path, config=config)
+        assert result.exit_code == 0
+        assert mock_scan.call_count == 1
+        assert "Total: 2 files" in result.output
+
+    def test_config_symlinked_roots_deduplicated(self, tmp_path, invoke):
+        # alias/sub is a different scan root than target, so only the
+        # realpath of each match shows that sub/a.log was already found
+        target = tmp_path / "target"
+        (target / "sub").mkdir(parents=True)
+        (target / "sub" / "a.log").write_text("log")
+        alias = tmp_path / "alias"
+        alias.symlink_to(target)
+
+        config = tmp_path / "clean.yaml"
+        config.write_text(
+            f"rules:\n"
+            f"  - name: Logs\n"
+            f"    paths:\n"
+            f"      - {target}\n"
+            f"      - {alias / 'sub'}\n"
+            f"    patterns:\n"
+            f"      - '*.log'\n"
+        )
+
+        result = invoke(clean, tmp_path, config=config)
+        assert result.exit_code == 0
+        assert "Total: 1 files" in result.output
+
 
 class TestDuplicatesEdgeCases:
-    def test_duplicates_nonexistent_dir(self):
-        result = runner.invoke(app, ["duplicates", "/nonexistent/path"])
+    def test_duplicates_nonexistent_dir(self, invoke):
+        result = invoke(duplicates, Path("/nonexistent/path"))
         assert result.exit_code == 1
 
-    def test_duplicates_empty_dir(self, tmp_path):
-        result = runner.invoke(app, ["duplicates", str(tmp_path)])
+    def test_duplicates_empty_dir(self, tmp_path, invoke):
+        result = invoke(duplicates, tmp_path)
         assert result.exit_code == 0
         assert "No duplicate" in result.output
 
-    def test_duplicates_no_duplicates(self, tmp_path):
+    def test_duplicates_no_duplicates(self, tmp_path, invoke):
         (tmp_path / "a.txt").write_text("unique content a")
         (tmp_path / "b.txt").write_text("unique content b")
-        result = runner.invoke(app, ["duplicates", str(tmp_path)])
+        result = invoke(duplicates, tmp_path)
         assert result.exit_code == 0
         assert "No duplicate" in result.output
 
-    def test_duplicates_with_min_size(self, tmp_path):
+    def test_duplicates_with_min_size(self, tmp_path, invoke):
         content = b"duplicate content here!"
         (tmp_path / "a.txt").write_bytes(content)
         (tmp_path / "b.txt").write_bytes(content)
-        result = runner.invoke(
-            app, ["duplicates", str(tmp_path), "--min-size", "1"]
-        )
+        result = invoke(duplicates, tmp_path, min_size=1)
         assert result.exit_code == 0
 
-    def test_duplicates_skip_hidden(self, tmp_path):
+    def test_duplicates_skip_hidden(self, tmp_path, invoke):
         content = b"dup"
         (tmp_path / "a.txt").write_bytes(content)
         (tmp_path / ".hidden.txt").write_bytes(content)
-        result = runner.invoke(
-            app, ["duplicates", str(tmp_path), "--skip-hidden"]
-        )
+        result = invoke(duplicates, tmp_path, skip_hidden=True)
         assert result.exit_code == 0
 
 
 class TestScannerEdgeCases:
-    def test_scan_symlink_not_followed_by_default(self, tmp_path):
-        real = tmp_path / "real.txt"
-        real.write_text("real")
-        link = tmp_path / "link.txt"
-        link.symlink_to(real)
-        result = runner.invoke(app, ["scan", str(tmp_path)])
+    def test_scan_symlink_not_followed_by_default(self, sample_tree, invoke):
+        result = invoke(scan_cmd, sample_tree)
         assert result.exit_code == 0
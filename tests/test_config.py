@@ -5,7 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-import yaml
 
 from fclean.config import CleanConfig, RuleConfig
 
@@ -121,6 +120,16 @@ class TestCleanConfig:
         cfg = CleanConfig.from_file(config_file)
         assert cfg.rules == []
 
+    def test_from_file_cached_until_modified(self, tmp_path):
+        config_file = tmp_path / "clean.yaml"
+        config_file.write_text("rules:\n  - name: first\n    paths: [/tmp]\n")
+        cfg = CleanConfig.from_file(config_file)
+        cfg.rules[0].paths.append("/mutated")
+        assert CleanConfig.from_file(config_file).rules[0].paths == ["/tmp"]
+
+        config_file.write_text("rules:\n  - name: second, longer\n")
+        assert CleanConfig.from_file(config_file).rules[0].name == "second, longer"
+
     def test_from_file_nonexistent_raises(self):
         from fclean.config import ConfigError
         with pytest.raises(ConfigError, match="not found"):
@@ -136,6 +145,14 @@ class TestCleanConfig:
         assert rule.paths == []
         assert rule.skip_hidden is False
 
+    def test_from_file_empty_list_keys(self, tmp_path):
+        config_file = tmp_path / "clean.yaml"
+        config_file.write_text("rules:\n  - name: bare\n    paths:\n    patterns:\n    extensions:\n")
+        rule = CleanConfig.from_file(config_file).rules[0]
+        assert rule.paths == []
+        assert rule.patterns == []
+        assert rule.extensions == []
+
     def test_from_file_skip_hidden_default_false(self, tmp_path):
         config_file = tmp_path / "clean.yaml"
         config_file.write_text("rules:\n  - name: norule\n")
@@ -1,51 +1,49 @@
 """Tests for rule modules (age, size, pattern, duplicate)."""
 
+import fnmatch
+import hashlib
+import os
 import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-from fclean.scanner import FileInfo
-from fclean.rules.age import parse_age, filter_by_age
-from fclean.rules.size import parse_size, filter_by_size, sort_by_size
-from fclean.rules.pattern import filter_by_pattern, filter_by_extension
-from fclean.rules.duplicate import find_duplicates
+from fclean.scanner import FileInfo, ScanResult
+from fclean.rules.age import parse_age, filter_by_age, select_by_age
+from fclean.rules.size import parse_size, filter_by_size, select_by_size, sort_by_size
+from fclean.rules.pattern import filter_by_pattern, filter_by_extension, select_by_pattern
+from fclean.rules.duplicate import _hash_full, _hash_partial, _new_hasher, find_duplicates
 
 
 # --- Helpers ---
 
+_NOW = time.time()
+
+
 def make_file(name: str, size: int = 100, mtime: float | None = None) -> FileInfo:
-    return FileInfo(
-        path=Path(f"/fake/{name}"),
-        size=size,
-        mtime=mtime or time.time(),
-        atime=mtime or time.time(),
-        ctime=mtime or time.time(),
-    )
+    if mtime is None:
+        mtime = _NOW
+    return FileInfo(path=Path(f"/fake/{name}"), size=size, mtime=mtime, atime=mtime, ctime=mtime)
 
 
 # --- Age tests ---
 
 class TestParseAge:
-    def test_days(self):
-        assert parse_age("30d") == 30 * 86400
-
-    def test_weeks(self):
-        assert parse_age("2w") == 2 * 604800
-
-    def test_months(self):
-        assert parse_age("6m") == 6 * 2592000
-
-    def test_years(self):
-        assert parse_age("1y") == 31536000
-
-    def test_invalid(self):
-        with pytest.raises(ValueError):
-            parse_age("abc")
-
-    def test_invalid_unit(self):
+    @pytest.mark.parametrize("text, expected", [
+        ("30d", 30 * 86400),
+        ("2w", 2 * 604800),
+        ("6m", 6 * 2592000),
+        ("1y", 31536000),
+        (" 3 D ", 3 * 86400),
+    ])
+    def test_valid(self, text, expected):
+        assert parse_age(text) == expected
+
+    @pytest.mark.parametrize("text", ["abc", "10x", "d"])
+    def test_invalid(self, text):
         with pytest.raises(ValueError):
-            parse_age("10x")
+            parse_age(text)
 
 
 class TestFilterByAge:
@@ -60,25 +58,31 @@ class TestFilterByAge:
     def test_empty_input(self):
         assert filter_by_age([], "30d") == []
 
+    def test_use_atime(self):
+        now = time.time()
+        f = make_file("a.txt", mtime=now)
+        f.atime = now - 86400 * 60
+        assert filter_by_age([f], "30d") == []
+        assert filter_by_age([f], "30d", use_mtime=False) == [f]
+
 
 # --- Size tests ---
 
 class TestParseSize:
-    def test_bytes(self):
-        assert parse_size("100B") == 100
-
-    def test_kb(self):
-        assert parse_size("1KB") == 1024
-
-    def test_mb(self):
-        assert parse_size("10MB") == 10 * 1024 ** 2
-
-    def test_gb(self):
-        assert parse_size("1.5GB") == int(1.5 * 1024 ** 3)
-
-    def test_invalid(self):
+    @pytest.mark.parametrize("text, expected", [
+        ("100B", 100),
+        ("1KB", 1024),
+        ("10MB", 10 * 1024 ** 2),
+        ("1.5GB", int(1.5 * 1024 ** 3)),
+        (" 2 kb ", 2048),
+    ])
+    def test_valid(self, text, expected):
+        assert parse_size(text) == expected
+
+    @pytest.mark.parametrize("text", ["big", "1.GB"])
+    def test_invalid(self, text):
         with pytest.raises(ValueError):
-            parse_size("big")
+            parse_size(text)
 
 
 class TestFilterBySize:
@@ -94,6 +98,21 @@ class TestFilterBySize:
         assert len(result) == 1
         assert result[0].path.name == "a"
 
+    def test_both_bounds_exclusive(self):
+        files = [make_file(n, size=s) for n, s in [("a", 0), ("b", 1024), ("c", 1500), ("d", 2048)]]
+        result = filter_by_size(files, larger_than="1KB", smaller_than="2KB")
+        assert [f.name for f in result] == ["c"]
+
+    def test_no_bounds_returns_copy(self):
+        files = [make_file("a", size=0), make_file("b", size=10)]
+        result = filter_by_size(files)
+        assert result == files
+        assert result is not files
+
+    def test_no_lower_bound_keeps_empty_files(self):
+        files = [make_file("empty", size=0)]
+        assert filter_by_size(files, smaller_than="1KB") == files
+
 
 class TestSortBySize:
     def test_descending(self):
@@ -102,36 +121,76 @@ class TestSortBySize:
         assert [f.path.name for f in result] == ["b", "c", "a"]
 
 
+class TestSelectColumns:
+    """select_by_* over ScanResult columns must agree with filter_by_*."""
+
+    @pytest.fixture
+    def files(self):
+        now = time.time()
+        return [
+            make_file("old.log", size=5000, mtime=now - 86400 * 60),
+            make_file("new.log", size=10),
+            make_file("old.bin", size=20, mtime=now - 86400 * 90),
+            make_file("big.txt", size=90000),
+        ]
+
+    @pytest.fixture
+    def result(self, files):
+        result = ScanResult()
+        for f in files:
+            st = SimpleNamespace(st_size=f.size, st_mtime=f.mtime, st_atime=f.atime, st_ctime=f.ctime)
+            result.append(f.path_str, f.name, st)
+        return result
+
+    def test_age(self, files, result):
+        assert result.select(select_by_age(result, "30d")) == filter_by_age(files, "30d")
+
+    def test_size(self, files, result):
+        expected = filter_by_size(files, larger_than="1KB", smaller_than="50KB")
+        assert result.select(select_by_size(result, "1KB", "50KB")) == expected
+
+    def test_pattern(self, files, result):
+        assert result.select(select_by_pattern(result, ["*.log"])) == filter_by_pattern(files, ["*.log"])
+
+    def test_chained_rows(self, files, result):
+        rows = select_by_age(result, "30d")
+        rows = select_by_pattern(result, ["*.log"], rows)
+        assert result.select(rows) == filter_by_pattern(filter_by_age(files, "30d"), ["*.log"])
+
+
 # --- Pattern tests ---
 
 class TestFilterByPattern:
-    def test_match_tmp(self):
-        files = [make_file("data.tmp"), make_file("report.pdf"), make_file("log.tmp")]
-        result = filter_by_pattern(files, ["*.tmp"])
-        assert len(result) == 2
-
-    def test_exclude(self):
-        files = [make_file("data.tmp"), make_file("report.pdf")]
-        result = filter_by_pattern(files, ["*.tmp"], exclude=True)
-        assert len(result) == 1
-        assert result[0].path.name == "report.pdf"
-
-    def test_multiple_patterns(self):
-        files = [make_file("a.tmp"), make_file("b.log"), make_file("c.txt")]
-        result = filter_by_pattern(files, ["*.tmp", "*.log"])
-        assert len(result) == 2
+    @pytest.mark.parametrize("names, patterns, exclude, expected", [
+        (["data.tmp", "report.pdf", "log.tmp"], ["*.tmp"], False, ["data.tmp", "log.tmp"]),
+        (["data.tmp", "report.pdf"], ["*.tmp"], True, ["report.pdf"]),
+        (["a.tmp", "b.log", "c.txt"], ["*.tmp", "*.log"], False, ["a.tmp", "b.log"]),
+    ])
+    def test_filter(self, names, patterns, exclude, expected):
+        result = filter_by_pattern([make_file(n) for n in names], patterns, exclude=exclude)
+        assert [f.name for f in result] == expected
+
+    def test_matches_fnmatch_semantics(self):
+        names = ["a.tmp", "a.tmpx", "~$doc", "x~", "[abc].txt", "b.txt", "Thumbs.db"]
+        patterns = ["*.tmp", "~$*", "*~", "[[]abc].txt", "Thumbs.db"]
+        result = filter_by_pattern([make_file(n) for n in names], patterns)
+        expected = [n for n in names if any(fnmatch.fnmatch(n, p) for p in patterns)]
+        assert [f.name for f in result] == expected
+
+    def test_empty_patterns(self):
+        files = [make_file("a.tmp")]
+        assert filter_by_pattern(files, []) == []
+        assert filter_by_pattern(files, [], exclude=True) == files
 
 
 class TestFilterByExtension:
-    def test_match(self):
-        files = [make_file("a.py"), make_file("b.txt"), make_file("c.py")]
-        result = filter_by_extension(files, [".py"])
-        assert len(result) == 2
-
-    def test_no_dot_prefix(self):
-        files = [make_file("a.log")]
-        result = filter_by_extension(files, ["log"])
-        assert len(result) == 1
+    @pytest.mark.parametrize("names, extensions, expected", [
+        (["a.py", "b.txt", "c.py"], [".py"], ["a.py", "c.py"]),
+        (["a.log"], ["log"], ["a.log"]),
+    ])
+    def test_filter(self, names, extensions, expected):
+        result = filter_by_extension([make_file(n) for n in names], extensions)
+        assert [f.name for f in result] == expected
 
 
 # --- Duplicate tests ---
@@ -141,6 +200,15 @@ class TestFindDuplicates:
         files = [make_file("a", size=100), make_file("b", size=200)]
         assert find_duplicates(files) == []
 
+    def test_unique_sizes_open_no_files(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("file opened")
+
+        monkeypatch.setattr("fclean.rules.duplicate._open_readonly", fail)
+        monkeypatch.setattr("builtins.open", fail)
+        files = [make_file(f"f{i}", size=100 + i) for i in range(50)]
+        assert find_duplicates(files, hasher=fail) == []
+
     def test_same_size_different_content(self):
         # Same size but different paths - since we can't actually read /fake/ paths,
         # hash functions will fail and return no duplicates
@@ -174,3 +242,155 @@ class TestFindDuplicates:
         files = [FileInfo.from_path(f1), FileInfo.from_path(f2)]
         # min_size bigger than file size -> no results
         assert find_duplicates(files, min_size=1000) == []
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        paths = []
+        for i in range(6):
+            p = tmp_path / f"f{i}.bin"
+            p.write_bytes(b"A" * 5000 if i % 2 else b"B" * 5000)
+            paths.append(p)
+
+        files = [FileInfo.from_path(p) for p in paths]
+        seq = find_duplicates(files, max_workers=1)
+        par = find_duplicates(files, max_workers=8)
+        assert len(seq) == len(par) == 2
+
+        def as_sets(groups):
+            return sorted(sorted(f.path.name for f in g.files) for g in groups)
+
+        assert as_sets(seq) == as_sets(par)
+
+    def test_few_files_hashed_without_pool(self, tmp_path, monkeypatch):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("thread pool started for a tiny input")
+
+        monkeypatch.setattr("fclean.rules.duplicate.ThreadPoolExecutor", no_pool)
+        for name in ("a.bin", "b.bin", "c.bin"):
+            (tmp_path / name).write_bytes(b"same")
+        files = [FileInfo.from_path(p) for p in sorted(tmp_path.iterdir())]
+        assert len(find_duplicates(files)) == 1
+
+    def test_custom_hasher(self, tmp_path):
+        # Groups above the byte-compare threshold go to the injected hasher
+        paths = []
+        for i in range(5):
+            p = tmp_path / f"f{i}.bin"
+            p.write_bytes(b"same")
+            paths.append(p)
+
+        files = [FileInfo.from_path(p) for p in paths]
+        assert find_duplicates(files, hasher=lambda p: p.name) == []
+        groups = find_duplicates(files, hasher=lambda p: "x")
+        assert len(groups) == 1
+        assert groups[0].hash == "x"
+        assert groups[0].count == 5
+
+    def test_small_group_byte_compared(self, tmp_path):
+        # Same size and same first 4KB; only the tail tells them apart
+        head = b"x" * 4096
+        contents = [head + b"AA", head + b"BB", head + b"AA", head + b"BB"]
+        paths = []
+        for i, data in enumerate(contents):
+            p = tmp_path / f"f{i}.bin"
+            p.write_bytes(data)
+            paths.append(p)
+
+        files = [FileInfo.from_path(p) for p in paths]
+        groups = find_duplicates(files, hasher=lambda p: "unused")
+        assert sorted(sorted(f.path.name for f in g.files) for g in groups) == [
+            ["f0.bin", "f2.bin"],
+            ["f1.bin", "f3.bin"],
+        ]
+        assert all(g.hash == "" for g in groups)
+
+    def test_pair_skips_quick_hash(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            "fclean.rules.duplicate._hash_partial", lambda p: calls.append(p) or "q"
+        )
+        f1 = tmp_path / "a.bin"
+        f2 = tmp_path / "b.bin"
+        f1.write_bytes(b"pair")
+        f2.write_bytes(b"pair")
+
+        groups = find_duplicates([FileInfo.from_path(f1), FileInfo.from_path(f2)])
+        assert calls == []
+        assert len(groups) == 1
+
+
+    def test_pair_differing_early_reads_one_block(self, tmp_path, monkeypatch):
+        reads = []
+        real_open = open
+
+        class Recording:
+            def __init__(self, path, mode):
+                self._f = real_open(path, mode)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+            def read(self, n):
+                reads.append(n)
+                return self._f.read(n)
+
+        monkeypatch.setattr("fclean.rules.duplicate.open", Recording, raising=False)
+        f1 = tmp_path / "a.bin"
+        f2 = tmp_path / "b.bin"
+        f1.write_bytes(b"a" + b"x" * (2 * 1024 * 1024))
+        f2.write_bytes(b"b" + b"x" * (2 * 1024 * 1024))
+
+        assert find_duplicates([FileInfo.from_path(f1), FileInfo.from_path(f2)]) == []
+        assert reads == [4096, 4096]
+
+class TestHashFull:
+    def test_matches_blake3_of_content(self, tmp_path):
+        blake3 = pytest.importorskip("blake3").blake3
+        f = tmp_path / "big.bin"
+        data = bytes(range(256)) * 1000
+        f.write_bytes(data)
+        assert _hash_full(f) == blake3(data).hexdigest()
+
+    def test_empty_file(self, tmp_path):
+        f = tmp_path / "empty.bin"
+        f.write_bytes(b"")
+        assert _hash_full(f) == _new_hasher().hexdigest()
+
+    def test_sha256_without_blake3(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("fclean.rules.duplicate.blake3", None)
+        f = tmp_path / "a.bin"
+        f.write_bytes(b"content")
+        assert _hash_full(f) == hashlib.sha256(b"content").hexdigest()
+
+    def test_missing_file(self, tmp_path):
+        assert _hash_full(tmp_path / "missing.bin") is None
+
+    def test_mmap_matches_read(self, tmp_path, monkeypatch):
+        f = tmp_path / "a.bin"
+        f.write_bytes(bytes(range(256)) * 1000)
+        read = _hash_full(f)
+        monkeypatch.setattr("fclean.rules.duplicate._MMAP_MIN_SIZE", 0)
+        assert _hash_full(f) == read
+
+
+class TestHashPartial:
+    def test_hashes_first_block_only(self, tmp_path):
+        a = tmp_path / "a.bin"
+        b = tmp_path / "b.bin"
+        a.write_bytes(b"x" * 4096 + b"tail-a")
+        b.write_bytes(b"x" * 4096 + b"tail-b")
+        assert _hash_partial(a) == _hash_partial(b)
+
+    def test_short_reads(self, tmp_path, monkeypatch):
+        f = tmp_path / "a.bin"
+        f.write_bytes(bytes(range(256)) * 20)
+        expected = _hash_partial(f)
+        real_read = os.read
+        # Network/FUSE filesystems may hand back a block in pieces
+        monkeypatch.setattr("fclean.rules.duplicate.os.read", lambda fd, n: real_read(fd, min(n, 1000)))
+        assert _hash_partial(f) == expected
+
+    def test_missing_file(self, tmp_path):
+        assert _hash_partial(tmp_path / "missing.bin") is None
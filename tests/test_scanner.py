@@ -1,9 +1,14 @@
 """Tests for scanner and safelist modules."""
 
+import os
+import threading
 from pathlib import Path
 
-from fclean.scanner import scan, FileInfo
-from fclean.safelist import is_safe
+import pytest
+
+from fclean import _statx
+from fclean.scanner import scan, FileInfo, ScanResult, _optimal_workers, _process_entries, _walk_files
+from fclean.safelist import is_safe, is_safe_dir
 
 
 class TestFileInfo:
@@ -23,6 +28,33 @@ class TestFileInfo:
         info = FileInfo.from_path(tmp_path)
         assert info is None
 
+    def test_cached_name_and_suffix(self):
+        info = FileInfo(path=Path("/fake/Report.TAR.GZ"))
+        assert info.name == "Report.TAR.GZ"
+        assert info.suffix_lower == ".gz"
+
+    def test_suffix_matches_pathlib(self):
+        for name in [".bashrc", "noext", "trailing.", "a.b.c", "x.LOG"]:
+            info = FileInfo(path=Path("/fake") / name)
+            assert info.suffix_lower == Path(name).suffix.lower()
+
+    def test_str_path_materialized_lazily(self, tmp_path):
+        info = FileInfo(path=str(tmp_path / "a.txt"))
+        assert info.path_str == str(tmp_path / "a.txt")
+        assert info.path == tmp_path / "a.txt"
+        assert info.path is info.path
+        assert info == FileInfo(path=tmp_path / "a.txt")
+
+    def test_slotted(self):
+        info = FileInfo(path="/fake/a.txt")
+        assert not hasattr(info, "__dict__")
+
+    def test_scan_sets_name(self, tmp_path):
+        (tmp_path / "a.TMP").write_text("x")
+        result = scan(tmp_path)
+        assert result.files[0].name == "a.TMP"
+        assert result.files[0].suffix_lower == ".tmp"
+
 
 class TestScan:
     def test_scan_empty_dir(self, tmp_path):
@@ -37,19 +69,142 @@ class TestScan:
         assert result.file_count == 2
         assert result.total_size == 8
 
-    def test_scan_recursive(self, tmp_path):
+    def test_scan_recursive(self, sample_tree):
+        result = scan(sample_tree)
+        assert result.file_count == 5
+        assert result.total_size == 2009
+
+    def test_skip_hidden(self, sample_tree):
+        result = scan(sample_tree, skip_hidden=True)
+        assert result.file_count == 4
+
+    def test_parallel_matches_single(self, tmp_path):
+        # One deep, wide subtree next to small ones
+        deep = tmp_path / "deep"
+        for i in range(5):
+            d = deep.joinpath(*[f"l{j}" for j in range(i + 1)])
+            d.mkdir(parents=True)
+            for k in range(10):
+                (d / f"f{k}.txt").write_text("x" * k)
+        (tmp_path / "small").mkdir()
+        (tmp_path / "small" / "s.txt").write_text("s")
+        (tmp_path / "root.txt").write_text("r")
+
+        single = scan(tmp_path, workers=1)
+        parallel = scan(tmp_path, workers=4)
+        assert sorted(single.paths) == sorted(parallel.paths)
+        assert single.total_size == parallel.total_size
+        assert parallel.file_count == 52
+
+    def test_parallel_empty_dir(self, tmp_path):
+        result = scan(tmp_path, workers=4)
+        assert result.file_count == 0
+
+    def test_parallel_worker_error_raised(self, tmp_path, monkeypatch):
+        for i in range(5):
+            (tmp_path / f"d{i}").mkdir()
+
+        def broken(*args):
+            raise ValueError("boom")
+
+        monkeypatch.setattr("fclean.scanner._list_dir", broken)
+        outcome = []
+
+        def run():
+            try:
+                scan(tmp_path, workers=4)
+            except ValueError as exc:
+                outcome.append(exc)
+
+        # A dead worker used to leave scan() blocked forever
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        t.join(timeout=10)
+        assert not t.is_alive()
+        assert [str(e) for e in outcome] == ["boom"]
+
+    def test_progress_every_interval_across_batches(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_text("x")
+        st = f.stat()
+        result = ScanResult()
+        calls = []
+        batch = [(str(f), "a.txt", st)] * 300
+        for _ in range(4):
+            _process_entries(result, batch, False, False, lambda n, size: calls.append(n))
+        assert calls == list(range(64, 1201, 64))
+
+    def test_progress_not_throttled_by_scan(self, tmp_path):
+        # Time-based throttling is left to the caller (the CLI spinner)
+        for i in range(200):
+            (tmp_path / f"f{i}.txt").write_text("x")
+        calls = []
+        scan(tmp_path, on_progress=lambda n, size: calls.append(n))
+        assert calls == [64, 128, 192]
+
+
+class TestOptimalWorkers:
+    def test_caps_locked_filesystems(self):
+        assert _optimal_workers("zfs", 16) == 4
+        assert _optimal_workers("btrfs", 2) == 2
+
+    def test_leaves_other_filesystems(self, monkeypatch):
+        monkeypatch.setattr("fclean.scanner.sys.platform", "linux")
+        assert _optimal_workers("ext4", 16) == 16
+
+    def test_caps_on_macos(self, monkeypatch):
+        monkeypatch.setattr("fclean.scanner.sys.platform", "darwin")
+        assert _optimal_workers("", 16) == 4
+
+
+class TestScanResult:
+    def test_columns_and_records(self, tmp_path):
+        f = tmp_path / "a.log"
+        f.write_text("abc")
+        result = ScanResult()
+        result.append(str(f), "a.log", os.stat(f))
+
+        assert result.file_count == 1
+        assert result.total_size == 3
+        assert list(result.sizes) == [3]
+        assert result[0] == FileInfo.from_path(f)
+        assert result.files == [result[0]]
+
+    def test_append_invalidates_files(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_text("x")
+        result = ScanResult()
+        result.append(str(f), "a.txt", os.stat(f))
+        assert len(result.files) == 1
+        result.append(str(f), "a.txt", os.stat(f))
+        assert len(result.files) == 2
+
+
+@pytest.mark.skipif(not _statx.available(), reason="statx not available")
+class TestStatx:
+    def test_matches_lstat(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_text("hello")
+        st = os.lstat(f)
+        fast = _statx.fast_stat(_statx.AT_FDCWD, os.fsencode(f))
+        assert fast.st_size == st.st_size == 5
+        assert fast.st_mode == st.st_mode
+        assert fast.st_mtime == pytest.approx(st.st_mtime)
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _statx.fast_stat(_statx.AT_FDCWD, os.fsencode(tmp_path / "missing"))
+
+    def test_walk_with_statx_matches_default(self, tmp_path):
         sub = tmp_path / "sub"
         sub.mkdir()
-        (tmp_path / "a.txt").write_text("a")
-        (sub / "b.txt").write_text("b")
-        result = scan(tmp_path)
-        assert result.file_count == 2
+        (tmp_path / "a.txt").write_text("aaa")
+        (sub / "b.txt").write_text("bbbbb")
 
-    def test_skip_hidden(self, tmp_path):
-        (tmp_path / "visible.txt").write_text("v")
-        (tmp_path / ".hidden.txt").write_text("h")
-        result = scan(tmp_path, skip_hidden=True)
-        assert result.file_count == 1
+        def sizes(**kw):
+            return sorted((path, st.st_size) for path, _name, st in _walk_files(tmp_path, **kw))
+
+        assert sizes(use_statx=True) == sizes()
 
 
 class TestSafelist:
@@ -65,3 +220,34 @@ class TestSafelist:
         f = tmp_path / ".bashrc"
         f.write_text("export PATH=")
         assert is_safe(f) is True
+
+    def test_safe_dir_matches_is_safe(self, tmp_path):
+        assert is_safe_dir("/usr/share") is is_safe("/usr/share/x.txt") is True
+        assert is_safe_dir(str(tmp_path)) is is_safe(tmp_path / "x.txt") is False
+
+    def test_scan_skips_safe_name_via_dir_cache(self, tmp_path):
+        (tmp_path / ".bashrc").write_text("x")
+        (tmp_path / "a.txt").write_text("x")
+        for workers in (1, 4):
+            result = scan(tmp_path, workers=workers)
+            assert result.skipped_safe == 1
+            assert result.names == ["a.txt"]
+
+    def test_walk_prunes_protected_dirs(self, tmp_path, monkeypatch):
+        (tmp_path / "keep").mkdir()
+        (tmp_path / "keep" / "a.txt").write_text("x")
+        (tmp_path / "skip" / "deep").mkdir(parents=True)
+        (tmp_path / "skip" / "deep" / "b.txt").write_text("x")
+        monkeypatch.setattr("fclean.scanner.is_safe_dir", lambda d: d.endswith("skip"))
+        for workers in (1, 4):
+            result = scan(tmp_path, workers=workers)
+            assert result.names == ["a.txt"]
+            assert result.skipped_dirs == 1
+
+    def test_protected_root_counted(self, tmp_path, monkeypatch):
+        (tmp_path / "a.txt").write_text("x")
+        monkeypatch.setattr("fclean.scanner.is_safe_dir", lambda d: True)
+        for workers in (1, 4):
+            result = scan(tmp_path, workers=workers)
+            assert result.file_count == 0
+            assert result.skipped_dirs == 1
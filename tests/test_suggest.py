@@ -7,7 +7,15 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from fclean.suggest import SuggestItem, _dir_stats, get_suggestions
+from fclean.suggest import SuggestItem, _dir_stats, clear_suggestions_cache, get_suggestions
+
+
+@pytest.fixture(autouse=True)
+def _fresh_suggestions():
+    # Tests patch the OS and _dir_stats, so don't reuse another test's results
+    clear_suggestions_cache()
+    yield
+    clear_suggestions_cache()
 
 
 class TestSuggestItem:
@@ -54,19 +62,18 @@ class TestDirStats:
         assert size == 9
         assert count == 3
 
-    def test_nested_directories(self, tmp_path):
-        sub = tmp_path / "sub"
-        sub.mkdir()
-        (tmp_path / "a.txt").write_bytes(b"aa")
-        (sub / "b.txt").write_bytes(b"bbb")
-        size, count = _dir_stats(tmp_path)
-        assert size == 5
-        assert count == 2
+    def test_nested_directories(self, sample_tree):
+        size, count = _dir_stats(sample_tree)
+        assert size == 2009
+        assert count == 5
 
     def test_nonexistent_directory(self):
-        size, count = _dir_stats(Path("/nonexistent/path/that/does/not/exist"))
-        assert size == 0
-        assert count == 0
+        assert _dir_stats(Path("/nonexistent/path/that/does/not/exist")) is None
+
+    def test_file_is_not_a_directory(self, tmp_path):
+        f = tmp_path / "file.txt"
+        f.write_bytes(b"x")
+        assert _dir_stats(f) is None
 
     def test_only_directories_no_files(self, tmp_path):
         (tmp_path / "subdir1").mkdir()
@@ -75,18 +82,34 @@ class TestDirStats:
         assert size == 0
         assert count == 0
 
+    def test_symlinks_not_followed(self, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "big.bin").write_bytes(b"x" * 100)
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "a.txt").write_bytes(b"aa")
+        (target / "link.bin").symlink_to(outside / "big.bin")
+        (target / "linkdir").symlink_to(outside)
+        size, count = _dir_stats(target)
+        assert size == 2
+        assert count == 1
+
 
 class TestGetSuggestions:
+    @pytest.mark.slow
     def test_returns_list(self):
         result = get_suggestions()
         assert isinstance(result, list)
 
+    @pytest.mark.slow
     def test_all_items_exist_and_have_files(self):
         result = get_suggestions()
         for item in result:
             assert item.exists is True
             assert item.file_count > 0
 
+    @pytest.mark.slow
     def test_items_are_suggest_item_instances(self):
         result = get_suggestions()
         for item in result:
@@ -95,40 +118,61 @@ class TestGetSuggestions:
             assert isinstance(item.path, Path)
             assert isinstance(item.description, str)
 
+    @pytest.mark.slow
     def test_no_items_with_zero_files(self):
         result = get_suggestions()
         for item in result:
             assert item.file_count > 0
 
     def test_get_suggestions_linux(self):
-        with patch("fclean.suggest.platform.system", return_value="Linux"):
-            with patch("fclean.suggest.Path.exists", return_value=False):
+        with patch("fclean.suggest._SYSTEM", "Linux"):
+            with patch("fclean.suggest._dir_stats", return_value=None):
                 result = get_suggestions()
                 # All paths don't exist so result should be empty
                 assert result == []
 
     def test_get_suggestions_windows(self):
-        with patch("fclean.suggest.platform.system", return_value="Windows"):
-            with patch("fclean.suggest.Path.exists", return_value=False):
+        with patch("fclean.suggest._SYSTEM", "Windows"):
+            with patch("fclean.suggest._dir_stats", return_value=None):
                 result = get_suggestions()
                 assert result == []
 
+    @pytest.mark.slow
     def test_get_suggestions_with_existing_dir(self, tmp_path):
         fake_cache = tmp_path / "fake_cache"
         fake_cache.mkdir()
         (fake_cache / "junk.bin").write_bytes(b"x" * 100)
 
-        with patch("fclean.suggest.platform.system", return_value="Linux"):
+        with patch("fclean.suggest._SYSTEM", "Linux"):
             with patch("fclean.suggest.Path", side_effect=lambda *a, **kw: Path(*a, **kw)):
                 # Can't easily mock platformdirs; just verify real call works
                 result = get_suggestions()
                 assert isinstance(result, list)
 
+    def test_results_cached_per_process(self, tmp_path):
+        (tmp_path / "junk.bin").write_bytes(b"x")
+        targets = (("Junk", lambda home, cache: tmp_path, "Junk files"),)
+        with (
+            patch("fclean.suggest._SYSTEM", "Linux"),
+            patch("fclean.suggest._POSIX_TARGETS", targets),
+            patch("fclean.suggest._is_wsl", return_value=False),
+        ):
+            first = get_suggestions()
+            with patch("fclean.suggest._dir_stats") as mock_stats:
+                second = get_suggestions()
+            mock_stats.assert_not_called()
+        assert [i.name for i in second] == ["Junk"]
+        # Callers get copies, so mutating one result doesn't touch the cache
+        first[0].size = -1
+        assert second[0].size == 1
+
+    @pytest.mark.slow
     def test_size_is_non_negative(self):
         result = get_suggestions()
         for item in result:
             assert item.size >= 0
 
+    @pytest.mark.slow
     def test_items_have_non_empty_names(self):
         result = get_suggestions()
         for item in result: